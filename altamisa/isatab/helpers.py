@@ -4,13 +4,17 @@ Module for helper functions of global use.
 """
 
 
-from typing import Any, List
+import io
+from typing import Any, List, TextIO
 import warnings
 
 from ..exceptions import ParseIsatabWarning
 
 __author__ = "Mathias Kuhring <mathias.kuhring@bih-charite.de>"
 
+#: Number of characters the writers collect in memory before passing them on to the output file
+OUTPUT_BUFFER_SIZE = 64 * 1024
+
 
 def is_ontology_term_ref(v: Any):
     """Duck typing check for objects of class `models.OntologyTermRef`"""
@@ -24,3 +28,13 @@ def list_strip(line: List[str]) -> List[str]:
         msg = f"Removed trailing whitespaces in fields of line: {line}"
         warnings.warn(msg, ParseIsatabWarning)
     return new_line
+
+
+def flush_buffer(buffer: io.StringIO, output_file: TextIO, min_size: int = 0):
+    """Pass the content of ``buffer`` on to ``output_file`` (which is neither flushed nor closed)
+    once it holds at least ``min_size`` characters"""
+    size = buffer.tell()
+    if size and size >= min_size:
+        output_file.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
@@ -43,7 +43,7 @@ class AnnotatedStr(str):
             setattr(self, key, value)
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class OntologyTermRef:
     """Reference to a term into an ontology.
 
@@ -108,7 +108,7 @@ def free_text_or_term_ref_ontology(value: FreeTextOrTermRef) -> Optional[str]:
         return ""
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Comment:
     """Representation of a ``Comment[*]`` cell."""
 
@@ -121,7 +121,7 @@ class Comment:
 # Types used in investigation files -------------------------------------------
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class OntologyRef:
     """Description of an ontology term source, as used for investigation file."""
 
@@ -139,7 +139,7 @@ class OntologyRef:
     headers: List[str]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class BasicInfo:
     """Basic metadata for an investigation or study (``INVESTIGATION`` or ``STUDY``)."""
 
@@ -161,7 +161,7 @@ class BasicInfo:
     headers: List[str]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class PublicationInfo:
     """Information regarding an investigation publication (``INVESTIGATION PUBLICATIONS``)."""
 
@@ -181,7 +181,7 @@ class PublicationInfo:
     headers: List[str]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class ContactInfo:
     """Investigation contact information"""
 
@@ -209,7 +209,7 @@ class ContactInfo:
     headers: List[str]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class DesignDescriptorsInfo:
     """Study design descriptors information"""
 
@@ -221,7 +221,7 @@ class DesignDescriptorsInfo:
     headers: List[str]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class FactorInfo:
     """Study factor information"""
 
@@ -235,7 +235,7 @@ class FactorInfo:
     headers: List[str]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class AssayInfo:
     """Study assay information"""
 
@@ -253,7 +253,7 @@ class AssayInfo:
     headers: List[str]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class ProtocolComponentInfo:
     """Protocol component information"""
 
@@ -263,7 +263,7 @@ class ProtocolComponentInfo:
     type: FreeTextOrTermRef
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class ProtocolInfo:
     """Protocol information"""
 
@@ -287,7 +287,7 @@ class ProtocolInfo:
     headers: List[str]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class StudyInfo:
     """The full metadata regarding one study"""
 
@@ -307,7 +307,7 @@ class StudyInfo:
     contacts: Tuple[ContactInfo, ...]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class InvestigationInfo:
     """Representation of an ISA investigation"""
 
@@ -338,7 +338,7 @@ InvestigationFieldWithComments = Union[
 # Types used in study and assay files -----------------------------------------
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Characteristics:
     """Representation of a ``Characteristics[*]`` cell."""
 
@@ -350,7 +350,7 @@ class Characteristics:
     unit: Optional[FreeTextOrTermRef]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class FactorValue:
     """Representation of a ``Factor Value[*]`` cell."""
 
@@ -362,7 +362,7 @@ class FactorValue:
     unit: Optional[FreeTextOrTermRef]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class ParameterValue:
     """Representation of a ``Parameter Value[*]`` cell."""
 
@@ -411,7 +411,7 @@ def build_parameter_value(
         return ParameterValue(name=name, value=list(value), unit=unit)
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Material:
     """Representation of a Material or Data node."""
 
@@ -439,7 +439,7 @@ class Material:
     headers: List[str]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Process:
     """Representation of a Process or Assay node."""
 
@@ -493,7 +493,7 @@ class Process:
 Node = Union[Material, Process]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Arc:
     """Representation of an arc between two ``Material`` and/or ``Process`` nodes."""
 
@@ -512,7 +512,7 @@ class Arc:
             raise IndexError(f"Invalid index: {idx}")  # pragma: no cover
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Study:
     """Representation of an ISA study."""
 
@@ -529,7 +529,7 @@ class Study:
     arcs: Tuple[Arc, ...]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Assay:
     """Representation of an ISA assay."""
 
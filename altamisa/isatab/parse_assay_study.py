@@ -8,6 +8,7 @@ from __future__ import generator_stop
 import csv
 from datetime import datetime
 from pathlib import Path
+import sys
 from typing import (
     Callable,
     Dict,
@@ -54,6 +55,16 @@ TNode = TypeVar("TNode")
 #: Type variable for cells/value.
 TCell = TypeVar("TCell")
 
+#: Shared (immutable) term reference for empty term cells, which are frequent in large files
+_EMPTY_TERM_REF = models.OntologyTermRef()
+
+
+# Helper to build a term reference, reusing the shared instance for empty cells
+def _build_term_ref(name: str, accession: str, ontology_name: str) -> models.OntologyTermRef:
+    if not (name or accession or ontology_name):
+        return _EMPTY_TERM_REF
+    return models.OntologyTermRef(name, accession, ontology_name)
+
 
 class _NodeBuilderBase(Generic[TNode]):
     """Base class for Material and Process builder objects"""
@@ -280,8 +291,7 @@ class _NodeBuilderBase(Generic[TNode]):
                 # There must be one ontology_name and accession per name
                 if len(name) == len(ontology_name) and len(name) == len(accession):
                     term_refs = [
-                        models.OntologyTermRef(n, a, o)
-                        for n, a, o in zip(name, accession, ontology_name)
+                        _build_term_ref(n, a, o) for n, a, o in zip(name, accession, ontology_name)
                     ]
                     return term_refs
                 else:  # pragma: no cover
@@ -293,7 +303,7 @@ class _NodeBuilderBase(Generic[TNode]):
 
             # Else, just create single ontology term references
             else:
-                return models.OntologyTermRef(name, accession, ontology_name)
+                return _build_term_ref(name, accession, ontology_name)
         else:
             if allow_list:
                 return self._token_with_escape(line[header.col_no])
@@ -487,7 +497,7 @@ class _ProcessBuilder(_NodeBuilderBase[models.Process]):
             assert self.protocol_ref_header, "invariant: checked above"
             # Name header is not given, will use auto-generated unique name
             # based on protocol ref.
-            protocol_ref = line[self.protocol_ref_header.col_no]
+            protocol_ref = sys.intern(line[self.protocol_ref_header.col_no])
             name_val = "{}{}-{}-{}-{}".format(
                 self.study_id,
                 assay_id,
@@ -515,7 +525,8 @@ class _ProcessBuilder(_NodeBuilderBase[models.Process]):
                 )
                 unique_name = models.AnnotatedStr(name_val, was_empty=True)
         else:  # Both header are given
-            protocol_ref = line[self.protocol_ref_header.col_no]
+            # Protocol references repeat in every row, so share one string per protocol
+            protocol_ref = sys.intern(line[self.protocol_ref_header.col_no])
             name = line[self.name_header.col_no]
             name_type = self.name_header.column_type
             if name:
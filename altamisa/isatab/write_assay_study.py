@@ -7,6 +7,7 @@ from __future__ import generator_stop
 
 import csv
 import functools
+import io
 import os
 from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple, Type, Union
 
@@ -19,7 +20,7 @@ from .headers import (
     HeaderParserBase,
     StudyHeaderParser,
 )
-from .helpers import is_ontology_term_ref
+from .helpers import OUTPUT_BUFFER_SIZE, flush_buffer
 from .models import Arc, Assay, Material, OntologyTermRef, Process, Study
 
 __author__ = (
@@ -193,6 +194,8 @@ class _WriterBase:
     _ref_table: List[List[str]]
     # Headers for output
     _headers: List[List[ColumnHeader]]
+    # Simple header names (first simple string of each header) for output, per header group
+    _header_names: List[List[str]]
 
     @classmethod
     def from_stream(
@@ -220,9 +223,11 @@ class _WriterBase:
         self.output_file = output_file
         # Character for quoting
         self.quote = quote
+        # In-memory buffer collecting the written rows, passed on to the output file in chunks
+        self._buffer = io.StringIO()
         # Csv file writer
         self._writer = csv.writer(
-            output_file,
+            self._buffer,
             delimiter="\t",
             lineterminator=lineterminator or os.linesep,
             quoting=csv.QUOTE_ALL if self.quote else csv.QUOTE_NONE,
@@ -234,6 +239,7 @@ class _WriterBase:
     def _write_next_line(self, line: List[str]):
         """Write next line."""
         self._writer.writerow(line)
+        flush_buffer(self._buffer, self.output_file, OUTPUT_BUFFER_SIZE)
 
     def _extract_headers(self):
         """
@@ -253,6 +259,10 @@ class _WriterBase:
                 # TODO: create new headers based on attributes
                 msg = f"No reference headers available in node {node.unique_name} of first row"
                 raise WriteIsatabException(msg)
+        # Header names are looked up for every row, so derive them only once
+        self._header_names = [
+            [header.get_simple_string()[0] for header in headers] for headers in self._headers
+        ]
 
     def _write_headers(self):
         # Unlist node headers
@@ -278,13 +288,12 @@ class _WriterBase:
 
             # Iterate nodes and corresponding headers
             line = []
-            for node_name, headers in zip(row, self._headers):
+            for node_name, header_names in zip(row, self._header_names):
                 # Extract node attributes
                 node = self._nodes[node_name]
                 attributes = self._extract_attributes(node)
                 self._previous_attribute = None
-                for header in headers:
-                    header = header.get_simple_string()[0]
+                for header in header_names:
                     # Append next attribute according to header
                     self._append_attribute(line, attributes, header, node)
                 # Iterating the headers should deplete attributes
@@ -306,7 +315,7 @@ class _WriterBase:
                 self._append_attribute_with_value(line, attribute, attributes)
             # Append attribute with direct ontology:
             # (extract_label, first_dimension, material_type, second_dimension)
-            elif is_ontology_term_ref(attribute):
+            elif isinstance(attribute, OntologyTermRef):
                 line.append(attribute.name)
                 attributes[table_headers.TERM_SOURCE_REF] = attribute
             # Append attributes with string only (everything else)
@@ -323,7 +332,7 @@ class _WriterBase:
     @staticmethod
     def _append_attribute_ontology_reference(line, attribute, header, node):
         # Append expected ontology reference
-        if is_ontology_term_ref(attribute):
+        if isinstance(attribute, OntologyTermRef):
             line.extend([attribute.ontology_name or "", attribute.accession or ""])
         else:  # pragma: no cover
             msg = (
@@ -338,12 +347,12 @@ class _WriterBase:
         # (Characteristics, Comment, FactorValue, ParameterValue)
 
         # If available, add Ontology to dict for next header
-        if is_ontology_term_ref(attribute.value):
+        if isinstance(attribute.value, OntologyTermRef):
             line.append(attribute.value.name or "")
             attributes[table_headers.TERM_SOURCE_REF] = attribute.value
         # Cases for attributes with lists of values allowed (Characteristics, ParameterValue)
         elif isinstance(attribute.value, list):
-            if is_ontology_term_ref(attribute.value[0]):
+            if isinstance(attribute.value[0], OntologyTermRef):
                 name = ";".join(
                     [v.name.replace(";", "\\;") if v.name else "" for v in attribute.value]
                 )
@@ -369,7 +378,7 @@ class _WriterBase:
         # If available, add Unit to dict for next header
         # (Characteristics, FactorValue, ParameterValue)
         if hasattr(attribute, "unit") and attribute.unit is not None:
-            if is_ontology_term_ref(attribute.unit):
+            if isinstance(attribute.unit, OntologyTermRef):
                 attributes[table_headers.UNIT] = attribute.unit.name
                 attributes[table_headers.TERM_SOURCE_REF] = attribute.unit
             else:
@@ -441,9 +450,16 @@ class _WriterBase:
             self._model.arcs,
             functools.partial(_is_of_starting_type, self._starting_type),
         ).run()
-        self._extract_headers()
-        self._write_headers()
-        self._extract_and_write_nodes()
+        try:
+            self._extract_headers()
+            self._write_headers()
+            self._extract_and_write_nodes()
+        finally:
+            self.flush()
+
+    def flush(self):
+        """Pass the remaining buffered rows on to the output file"""
+        flush_buffer(self._buffer, self.output_file)
 
 
 class StudyWriter(_WriterBase):
@@ -5,13 +5,19 @@
 from __future__ import generator_stop
 
 import csv
+import functools
+import io
+import itertools
+import operator
 import os
-from typing import Collection, Dict, List, Optional, TextIO
+import re
+from typing import Collection, Dict, Iterable, List, Mapping, Optional, TextIO, Tuple
 import warnings
 
 from . import models
 from ..constants import investigation_headers
 from ..exceptions import WriteIsatabException, WriteIsatabWarning
+from .helpers import OUTPUT_BUFFER_SIZE, flush_buffer
 
 __author__ = (
     "Manuel Holtgrewe <manuel.holtgrewe@bih-charite.de>, "
@@ -20,13 +26,21 @@ __author__ = (
 
 
 # Helper to extract comments and align them into rows
-def _extract_comments(section_objects: Collection[models.InvestigationFieldWithComments]):
-    names = sorted({comment.name for obj in section_objects for comment in obj.comments})
-    comments = {name: [""] * len(section_objects) for name in names}
+def _extract_comments(
+    section_objects: Collection[models.InvestigationFieldWithComments],
+) -> Dict[str, Iterable[str]]:
+    # Only keep the values actually given (by object index), rows are filled up when written.
+    # Comment names keep the order in which they are first seen.
+    comments: Dict[str, Dict[int, str]] = {}
     for i, obj in enumerate(section_objects):
         for comment in obj.comments:
+            if comment.name not in comments:
+                comments[comment.name] = {}
             comments[comment.name][i] = comment.value
-    return comments
+    n = len(section_objects)
+    return {
+        name: map(values.get, range(n), itertools.repeat("")) for name, values in comments.items()
+    }
 
 
 # Helper to extract a section header
@@ -44,9 +58,92 @@ def _extract_section_header(first_entry, section_name):
         return None
 
 
-# Helper to create a dict with keys to empty lists
-def _init_multi_column_section(section_keys) -> dict:
-    return {key: [] for key in section_keys}
+# Helper to build the section columns (by key) from the rows built by ``getter`` per object
+def _build_columns(section_keys, getter, section_objects) -> Dict[str, list]:
+    rows = [getter(obj) for obj in section_objects]
+    for row in rows:
+        if len(row) != len(section_keys):  # pragma: no cover
+            msg = f"Row with {len(row)} values does not match section keys {section_keys}"
+            raise WriteIsatabException(msg)
+    if not rows:
+        return {key: [] for key in section_keys}
+    return dict(zip(section_keys, map(list, zip(*rows))))
+
+
+# Helper to get name, accession and ontology of a free text or term reference as 3-tuple.
+# Dispatches on the value type, the default implementation handles empty (``None``) values.
+@functools.singledispatch
+def _term_ref_triple(value: models.FreeTextOrTermRef) -> Tuple[str, str, str]:
+    return ("", "", "")
+
+
+@_term_ref_triple.register
+def _(value: str) -> Tuple[str, str, str]:
+    return (value, "", "")
+
+
+@_term_ref_triple.register
+def _(value: models.OntologyTermRef) -> Tuple[str, str, str]:
+    return (value.name or "", value.accession or "", value.ontology_name or "")
+
+
+# Helper to join equally sized tuples column-wise by ``;`` (or get ``width`` empty strings)
+def _join_columns(rows: List[tuple], width: int) -> Iterable[str]:
+    if len(rows) > 1:
+        return map(";".join, zip(*rows))
+    elif rows:
+        # A single entry needs no joining
+        return rows[0]
+    else:
+        return ("",) * width
+
+
+# Getters for the plain (i.e. not free text or term reference) fields of section objects
+_get_ontology_ref_fields = operator.attrgetter("name", "file", "version", "description")
+_get_publication_fields = operator.attrgetter("pubmed_id", "doi", "authors", "title")
+_get_contact_fields = operator.attrgetter(
+    "last_name", "first_name", "mid_initial", "email", "phone", "fax", "address", "affiliation"
+)
+
+
+# Helpers to build the line values of one section object as a row (in order of the section keys)
+def _publication_row(publication: models.PublicationInfo) -> tuple:
+    return (*_get_publication_fields(publication), *_term_ref_triple(publication.status))
+
+
+def _contact_row(contact: models.ContactInfo) -> tuple:
+    return (*_get_contact_fields(contact), *_term_ref_triple(contact.role))
+
+
+def _design_row(design: models.DesignDescriptorsInfo) -> tuple:
+    return _term_ref_triple(design.type)
+
+
+def _factor_row(factor: models.FactorInfo) -> tuple:
+    return (factor.name, *_term_ref_triple(factor.type))
+
+
+def _assay_row(assay: models.AssayInfo) -> tuple:
+    return (
+        assay.path or "",
+        *_term_ref_triple(assay.measurement_type),
+        *_term_ref_triple(assay.technology_type),
+        assay.platform,
+    )
+
+
+def _protocol_row(protocol: models.ProtocolInfo) -> tuple:
+    parameters = [_term_ref_triple(p) for p in protocol.parameters.values()]
+    components = [(c.name, *_term_ref_triple(c.type)) for c in protocol.components.values()]
+    return (
+        protocol.name,
+        *_term_ref_triple(protocol.type),
+        protocol.description,
+        protocol.uri,
+        protocol.version,
+        *_join_columns(parameters, 3),
+        *_join_columns(components, 4),
+    )
 
 
 class InvestigationWriter:
@@ -87,11 +184,17 @@ class InvestigationWriter:
         self.output_file = output_file
         # Quote for csv export
         self.quote = quote
+        # In-memory buffer collecting the written sections, passed on to the output file in chunks
+        self._buffer = io.StringIO()
+        # Line terminator for export
+        self._lineterminator = lineterminator or os.linesep
+        # Characters the csv writer would escape; lines without them can be joined directly
+        self._needs_escape = re.compile("[" + re.escape("\t\\|\r\n" + self._lineterminator) + "]")
         # Csv file writer
         self._writer = csv.writer(
-            output_file,
+            self._buffer,
             delimiter="\t",
-            lineterminator=lineterminator or os.linesep,
+            lineterminator=self._lineterminator,
             quoting=csv.QUOTE_NONE,
             # Can't use no quoting without escaping, so use different dummy quote here
             escapechar="\\",
@@ -100,70 +203,87 @@ class InvestigationWriter:
 
     def write(self):
         """Write investigation file"""
-        self._write_ontology_source_reference()
-        self._write_basic_info()
-        self._write_publications()
-        self._write_contacts()
-        self._write_studies()
-
-    def _write_line(self, header, values):
-        # Write an investigation line with header and values (potentially quoted)
-        if self.quote:
-            tpl = "".join((self.quote, "{}", self.quote))
-            values = [tpl.format(v) for v in values]
-        self._writer.writerow((header, *values))
+        try:
+            self._write_ontology_source_reference()
+            self._write_basic_info()
+            self._write_publications()
+            self._write_contacts()
+            self._write_studies()
+        finally:
+            self.flush()
+
+    def flush(self):
+        """Pass the remaining buffered lines on to the output file"""
+        flush_buffer(self._buffer, self.output_file)
+
+    def _build_line(self, header, values) -> tuple:
+        # Build an investigation line with header and values (potentially quoted)
+        quote = self.quote
+        if quote:
+            values = (f"{quote}{v}{quote}" for v in values)
+        return (header, *values)
 
     # Writer for headers and content of sections
     def _write_section(
         self,
         section_name: str,
-        section: Dict[str, list],
-        comments: Dict[str, list],
+        section: Mapping[str, Iterable],
+        comments: Mapping[str, Iterable[str]],
         headers: Optional[List[str]] = None,
     ):
-        # Add comments to section dict
-        if comments:
-            for key, value in comments.items():
-                section[f"Comment[{key}]"] = value
-        # Write the section name
-        self._writer.writerow((section_name,))
-        # Write the lines in this section.
+        # Add comments to (a copy of) the section dict
+        rows: Dict[str, Iterable] = dict(section)
+        rows.update({f"Comment[{key}]": value for key, value in comments.items()})
+        # Collect the lines in this section
         if headers:
             # Use header order
-            self._write_section_by_header_order(headers, section, section_name)
+            items = self._iter_section_by_header_order(headers, rows, section_name)
         else:
             # Use dict order
-            for header, values in section.items():
-                self._write_line(header, values)
+            items = rows.items()
+        # Write the section name and lines at once
+        lines = [(section_name,)]
+        lines.extend(self._build_line(header, values) for header, values in items)
+        self._write_lines(lines)
+
+    def _write_lines(self, lines: List[tuple]):
+        # Join plain string lines directly, only use the csv writer if escaping may be required
+        try:
+            plain = not self._needs_escape.search("".join(itertools.chain.from_iterable(lines)))
+        except TypeError:  # non-string values (e.g. ``None``) are converted by the csv writer
+            plain = False
+        if plain:
+            terminator = self._lineterminator
+            self._buffer.write("".join(["\t".join(line) + terminator for line in lines]))
+        else:
+            self._writer.writerows(lines)
+        flush_buffer(self._buffer, self.output_file, OUTPUT_BUFFER_SIZE)
 
-    def _write_section_by_header_order(self, headers, section, section_name):
-        # Write section based on header order
+    def _iter_section_by_header_order(self, headers, section, section_name):
+        # Iterate section lines based on header order (without modifying the section)
+        consumed = set()
         for header in headers:
-            if header in section:
-                values = section.pop(header)
-                self._write_line(header, values)
+            if header in section and header not in consumed:
+                consumed.add(header)
+                yield header, section[header]
             else:  # pragma: no cover
                 msg = f"No data found for header {header} in section {section_name}"
                 raise WriteIsatabException(msg)
-        if len(section) > 0:  # pragma: no cover
-            msg = f"Leftover rows found in section {section_name}:\n{section}"
+        if len(consumed) < len(section):  # pragma: no cover
+            leftover = {k: v for k, v in section.items() if k not in consumed}
+            msg = f"Leftover rows found in section {section_name}:\n{leftover}"
             raise WriteIsatabException(msg)
 
     def _write_ontology_source_reference(self):
         # Write ONTOLOGY SOURCE REFERENCE section
-        section = _init_multi_column_section(investigation_headers.ONTOLOGY_SOURCE_REF_KEYS)
-        for ontology_ref in self.investigation.ontology_source_refs.values():
-            section[investigation_headers.TERM_SOURCE_NAME].append(ontology_ref.name)
-            section[investigation_headers.TERM_SOURCE_FILE].append(ontology_ref.file)
-            section[investigation_headers.TERM_SOURCE_VERSION].append(ontology_ref.version)
-            section[investigation_headers.TERM_SOURCE_DESCRIPTION].append(ontology_ref.description)
+        section = _build_columns(
+            investigation_headers.ONTOLOGY_SOURCE_REF_KEYS,
+            _get_ontology_ref_fields,
+            self.investigation.ontology_source_refs.values(),
+        )
         comments = _extract_comments(self.investigation.ontology_source_refs.values())
         headers = _extract_section_header(
-            (
-                list(self.investigation.ontology_source_refs.values())[0]
-                if self.investigation.ontology_source_refs
-                else None
-            ),
+            next(iter(self.investigation.ontology_source_refs.values()), None),
             investigation_headers.ONTOLOGY_SOURCE_REFERENCE,
         )
         self._write_section(
@@ -190,26 +310,14 @@ class InvestigationWriter:
 
     def _write_publications(self):
         # Write INVESTIGATION PUBLICATIONS section
-        section = _init_multi_column_section(investigation_headers.INVESTIGATION_PUBLICATIONS_KEYS)
-        for publication in self.investigation.publications:
-            section[investigation_headers.INVESTIGATION_PUBMED_ID].append(publication.pubmed_id)
-            section[investigation_headers.INVESTIGATION_PUBLICATION_DOI].append(publication.doi)
-            section[investigation_headers.INVESTIGATION_PUBLICATION_AUTHOR_LIST].append(
-                publication.authors
-            )
-            section[investigation_headers.INVESTIGATION_PUBLICATION_TITLE].append(publication.title)
-            section[investigation_headers.INVESTIGATION_PUBLICATION_STATUS].append(
-                models.free_text_or_term_ref_to_str(publication.status) or ""
-            )
-            section[
-                investigation_headers.INVESTIGATION_PUBLICATION_STATUS_TERM_ACCESSION_NUMBER
-            ].append(models.free_text_or_term_ref_accession(publication.status) or "")
-            section[investigation_headers.INVESTIGATION_PUBLICATION_STATUS_TERM_SOURCE_REF].append(
-                models.free_text_or_term_ref_ontology(publication.status) or ""
-            )
+        section = _build_columns(
+            investigation_headers.INVESTIGATION_PUBLICATIONS_KEYS,
+            _publication_row,
+            self.investigation.publications,
+        )
         comments = _extract_comments(self.investigation.publications)
         headers = _extract_section_header(
-            list(self.investigation.publications)[0] if self.investigation.publications else None,
+            next(iter(self.investigation.publications), None),
             investigation_headers.INVESTIGATION_PUBLICATIONS,
         )
         self._write_section(
@@ -218,34 +326,14 @@ class InvestigationWriter:
 
     def _write_contacts(self):
         # Write INVESTIGATION CONTACTS section
-        section = _init_multi_column_section(investigation_headers.INVESTIGATION_CONTACTS_KEYS)
-        for contact in self.investigation.contacts:
-            section[investigation_headers.INVESTIGATION_PERSON_LAST_NAME].append(contact.last_name)
-            section[investigation_headers.INVESTIGATION_PERSON_FIRST_NAME].append(
-                contact.first_name
-            )
-            section[investigation_headers.INVESTIGATION_PERSON_MID_INITIALS].append(
-                contact.mid_initial
-            )
-            section[investigation_headers.INVESTIGATION_PERSON_EMAIL].append(contact.email)
-            section[investigation_headers.INVESTIGATION_PERSON_PHONE].append(contact.phone)
-            section[investigation_headers.INVESTIGATION_PERSON_FAX].append(contact.fax)
-            section[investigation_headers.INVESTIGATION_PERSON_ADDRESS].append(contact.address)
-            section[investigation_headers.INVESTIGATION_PERSON_AFFILIATION].append(
-                contact.affiliation
-            )
-            section[investigation_headers.INVESTIGATION_PERSON_ROLES].append(
-                models.free_text_or_term_ref_to_str(contact.role) or ""
-            )
-            section[investigation_headers.INVESTIGATION_PERSON_ROLES_TERM_ACCESSION_NUMBER].append(
-                models.free_text_or_term_ref_accession(contact.role) or ""
-            )
-            section[investigation_headers.INVESTIGATION_PERSON_ROLES_TERM_SOURCE_REF].append(
-                models.free_text_or_term_ref_ontology(contact.role) or ""
-            )
+        section = _build_columns(
+            investigation_headers.INVESTIGATION_CONTACTS_KEYS,
+            _contact_row,
+            self.investigation.contacts,
+        )
         comments = _extract_comments(self.investigation.contacts)
         headers = _extract_section_header(
-            list(self.investigation.contacts)[0] if self.investigation.contacts else None,
+            next(iter(self.investigation.contacts), None),
             investigation_headers.INVESTIGATION_CONTACTS,
         )
         self._write_section(
@@ -280,20 +368,12 @@ class InvestigationWriter:
 
     def _write_study_design_descriptors(self, study: models.StudyInfo):
         # Read STUDY DESIGN DESCRIPTORS section
-        section = _init_multi_column_section(investigation_headers.STUDY_DESIGN_DESCR_KEYS)
-        for design in study.designs:
-            section[investigation_headers.STUDY_DESIGN_TYPE].append(
-                models.free_text_or_term_ref_to_str(design.type) or ""
-            )
-            section[investigation_headers.STUDY_DESIGN_TYPE_TERM_ACCESSION_NUMBER].append(
-                models.free_text_or_term_ref_accession(design.type) or ""
-            )
-            section[investigation_headers.STUDY_DESIGN_TYPE_TERM_SOURCE_REF].append(
-                models.free_text_or_term_ref_ontology(design.type) or ""
-            )
+        section = _build_columns(
+            investigation_headers.STUDY_DESIGN_DESCR_KEYS, _design_row, study.designs
+        )
         comments = _extract_comments(study.designs)
         headers = _extract_section_header(
-            list(study.designs)[0] if study.designs else None,
+            next(iter(study.designs), None),
             investigation_headers.STUDY_DESIGN_DESCRIPTORS,
         )
         self._write_section(
@@ -302,167 +382,57 @@ class InvestigationWriter:
 
     def _write_study_publications(self, study: models.StudyInfo):
         # Write STUDY PUBLICATIONS section
-        section = _init_multi_column_section(investigation_headers.STUDY_PUBLICATIONS_KEYS)
-        for publication in study.publications:
-            section[investigation_headers.STUDY_PUBMED_ID].append(publication.pubmed_id)
-            section[investigation_headers.STUDY_PUBLICATION_DOI].append(publication.doi)
-            section[investigation_headers.STUDY_PUBLICATION_AUTHOR_LIST].append(publication.authors)
-            section[investigation_headers.STUDY_PUBLICATION_TITLE].append(publication.title)
-            section[investigation_headers.STUDY_PUBLICATION_STATUS].append(
-                models.free_text_or_term_ref_to_str(publication.status) or ""
-            )
-            section[investigation_headers.STUDY_PUBLICATION_STATUS_TERM_ACCESSION_NUMBER].append(
-                models.free_text_or_term_ref_accession(publication.status) or ""
-            )
-            section[investigation_headers.STUDY_PUBLICATION_STATUS_TERM_SOURCE_REF].append(
-                models.free_text_or_term_ref_ontology(publication.status) or ""
-            )
+        section = _build_columns(
+            investigation_headers.STUDY_PUBLICATIONS_KEYS, _publication_row, study.publications
+        )
         comments = _extract_comments(study.publications)
         headers = _extract_section_header(
-            list(study.publications)[0] if study.publications else None,
+            next(iter(study.publications), None),
             investigation_headers.STUDY_PUBLICATIONS,
         )
         self._write_section(investigation_headers.STUDY_PUBLICATIONS, section, comments, headers)
 
     def _write_study_factors(self, study: models.StudyInfo):
         # Write STUDY FACTORS section
-        section = _init_multi_column_section(investigation_headers.STUDY_FACTORS_KEYS)
-        for factor in study.factors.values():
-            section[investigation_headers.STUDY_FACTOR_NAME].append(factor.name)
-            section[investigation_headers.STUDY_FACTOR_TYPE].append(
-                models.free_text_or_term_ref_to_str(factor.type) or ""
-            )
-            section[investigation_headers.STUDY_FACTOR_TYPE_TERM_ACCESSION_NUMBER].append(
-                models.free_text_or_term_ref_accession(factor.type) or ""
-            )
-            section[investigation_headers.STUDY_FACTOR_TYPE_TERM_SOURCE_REF].append(
-                models.free_text_or_term_ref_ontology(factor.type) or ""
-            )
+        section = _build_columns(
+            investigation_headers.STUDY_FACTORS_KEYS, _factor_row, study.factors.values()
+        )
         comments = _extract_comments(study.factors.values())
         headers = _extract_section_header(
-            list(study.factors.values())[0] if study.factors else None,
+            next(iter(study.factors.values()), None),
             investigation_headers.STUDY_FACTORS,
         )
         self._write_section(investigation_headers.STUDY_FACTORS, section, comments, headers)
 
     def _write_study_assays(self, study: models.StudyInfo):
         # Write STUDY ASSAYS section
-        section = _init_multi_column_section(investigation_headers.STUDY_ASSAYS_KEYS)
-        for assay in study.assays:
-            section[investigation_headers.STUDY_ASSAY_FILE_NAME].append(assay.path or "")
-
-            section[investigation_headers.STUDY_ASSAY_MEASUREMENT_TYPE].append(
-                models.free_text_or_term_ref_to_str(assay.measurement_type) or ""
-            )
-            section[
-                investigation_headers.STUDY_ASSAY_MEASUREMENT_TYPE_TERM_ACCESSION_NUMBER
-            ].append(models.free_text_or_term_ref_accession(assay.measurement_type) or "")
-            section[investigation_headers.STUDY_ASSAY_MEASUREMENT_TYPE_TERM_SOURCE_REF].append(
-                models.free_text_or_term_ref_ontology(assay.measurement_type) or ""
-            )
-
-            section[investigation_headers.STUDY_ASSAY_TECHNOLOGY_TYPE].append(
-                models.free_text_or_term_ref_to_str(assay.technology_type) or ""
-            )
-            section[investigation_headers.STUDY_ASSAY_TECHNOLOGY_TYPE_TERM_ACCESSION_NUMBER].append(
-                models.free_text_or_term_ref_accession(assay.technology_type) or ""
-            )
-            section[investigation_headers.STUDY_ASSAY_TECHNOLOGY_TYPE_TERM_SOURCE_REF].append(
-                models.free_text_or_term_ref_ontology(assay.technology_type) or ""
-            )
-
-            section[investigation_headers.STUDY_ASSAY_TECHNOLOGY_PLATFORM].append(assay.platform)
-
+        section = _build_columns(investigation_headers.STUDY_ASSAYS_KEYS, _assay_row, study.assays)
         comments = _extract_comments(study.assays)
         headers = _extract_section_header(
-            list(study.assays)[0] if study.assays else None, investigation_headers.STUDY_ASSAYS
+            next(iter(study.assays), None), investigation_headers.STUDY_ASSAYS
         )
         self._write_section(investigation_headers.STUDY_ASSAYS, section, comments, headers)
 
     def _write_study_protocols(self, study: models.StudyInfo):
         # Write STUDY PROTOCOLS section
-        section = _init_multi_column_section(investigation_headers.STUDY_PROTOCOLS_KEYS)
-        for protocol in study.protocols.values():
-            section[investigation_headers.STUDY_PROTOCOL_NAME].append(protocol.name)
-
-            section[investigation_headers.STUDY_PROTOCOL_TYPE].append(
-                models.free_text_or_term_ref_to_str(protocol.type) or ""
-            )
-            section[investigation_headers.STUDY_PROTOCOL_TYPE_TERM_ACCESSION_NUMBER].append(
-                models.free_text_or_term_ref_accession(protocol.type) or ""
-            )
-            section[investigation_headers.STUDY_PROTOCOL_TYPE_TERM_SOURCE_REF].append(
-                models.free_text_or_term_ref_ontology(protocol.type) or ""
-            )
-
-            section[investigation_headers.STUDY_PROTOCOL_DESCRIPTION].append(protocol.description)
-            section[investigation_headers.STUDY_PROTOCOL_URI].append(protocol.uri)
-            section[investigation_headers.STUDY_PROTOCOL_VERSION].append(protocol.version)
-
-            names = []
-            accessions = []
-            ontologies = []
-            for parameter in protocol.parameters.values():
-                names.append(models.free_text_or_term_ref_to_str(parameter) or "")
-                accessions.append(models.free_text_or_term_ref_accession(parameter) or "")
-                ontologies.append(models.free_text_or_term_ref_ontology(parameter) or "")
-            section[investigation_headers.STUDY_PROTOCOL_PARAMETERS_NAME].append(";".join(names))
-            section[
-                investigation_headers.STUDY_PROTOCOL_PARAMETERS_NAME_TERM_ACCESSION_NUMBER
-            ].append(";".join(accessions))
-            section[investigation_headers.STUDY_PROTOCOL_PARAMETERS_NAME_TERM_SOURCE_REF].append(
-                ";".join(ontologies)
-            )
-
-            names = []
-            types = []
-            accessions = []
-            ontologies = []
-            for component in protocol.components.values():
-                names.append(component.name)
-                types.append(models.free_text_or_term_ref_to_str(component.type) or "")
-                accessions.append(models.free_text_or_term_ref_accession(component.type) or "")
-                ontologies.append(models.free_text_or_term_ref_ontology(component.type) or "")
-            section[investigation_headers.STUDY_PROTOCOL_COMPONENTS_NAME].append(";".join(names))
-            section[investigation_headers.STUDY_PROTOCOL_COMPONENTS_TYPE].append(";".join(types))
-            section[
-                investigation_headers.STUDY_PROTOCOL_COMPONENTS_TYPE_TERM_ACCESSION_NUMBER
-            ].append(";".join(accessions))
-            section[investigation_headers.STUDY_PROTOCOL_COMPONENTS_TYPE_TERM_SOURCE_REF].append(
-                ";".join(ontologies)
-            )
-
+        section = _build_columns(
+            investigation_headers.STUDY_PROTOCOLS_KEYS, _protocol_row, study.protocols.values()
+        )
         comments = _extract_comments(study.protocols.values())
         headers = _extract_section_header(
-            list(study.protocols.values())[0] if study.protocols else None,
+            next(iter(study.protocols.values()), None),
             investigation_headers.STUDY_PROTOCOLS,
         )
         self._write_section(investigation_headers.STUDY_PROTOCOLS, section, comments, headers)
 
     def _write_study_contacts(self, study: models.StudyInfo):
         # Write STUDY CONTACTS section
-        section = _init_multi_column_section(investigation_headers.STUDY_CONTACTS_KEYS)
-        for contact in study.contacts:
-            section[investigation_headers.STUDY_PERSON_LAST_NAME].append(contact.last_name)
-            section[investigation_headers.STUDY_PERSON_FIRST_NAME].append(contact.first_name)
-            section[investigation_headers.STUDY_PERSON_MID_INITIALS].append(contact.mid_initial)
-            section[investigation_headers.STUDY_PERSON_EMAIL].append(contact.email)
-            section[investigation_headers.STUDY_PERSON_PHONE].append(contact.phone)
-            section[investigation_headers.STUDY_PERSON_FAX].append(contact.fax)
-            section[investigation_headers.STUDY_PERSON_ADDRESS].append(contact.address)
-            section[investigation_headers.STUDY_PERSON_AFFILIATION].append(contact.affiliation)
-            section[investigation_headers.STUDY_PERSON_ROLES].append(
-                models.free_text_or_term_ref_to_str(contact.role) or ""
-            )
-            section[investigation_headers.STUDY_PERSON_ROLES_TERM_ACCESSION_NUMBER].append(
-                models.free_text_or_term_ref_accession(contact.role) or ""
-            )
-            section[investigation_headers.STUDY_PERSON_ROLES_TERM_SOURCE_REF].append(
-                models.free_text_or_term_ref_ontology(contact.role) or ""
-            )
+        section = _build_columns(
+            investigation_headers.STUDY_CONTACTS_KEYS, _contact_row, study.contacts
+        )
         comments = _extract_comments(study.contacts)
         headers = _extract_section_header(
-            list(study.contacts)[0] if study.contacts else None,
+            next(iter(study.contacts), None),
             investigation_headers.STUDY_CONTACTS,
         )
         self._write_section(investigation_headers.STUDY_CONTACTS, section, comments, headers)
@@ -10,14 +10,17 @@ def parse_requirements(path):
     """Parse ``requirements.txt`` at ``path``."""
     requirements = []
     with open(path, "rt") as reqs_f:
-        for line in reqs_f:
-            line = line.strip()
-            if line.startswith("-r"):
-                fname = line.split()[1]
-                inner_path = os.path.join(os.path.dirname(path), fname)
-                requirements += parse_requirements(inner_path)
-            elif line != "" and not line.startswith("#"):
-                requirements.append(line)
+        lines = reqs_f.read().splitlines()
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        elif line[:2] == "-r":
+            fname = line.split()[1]
+            inner_path = os.path.join(os.path.dirname(path), fname)
+            requirements += parse_requirements(inner_path)
+        else:
+            requirements.append(line)
     return requirements
 
 
@@ -5,44 +5,56 @@ import os.path
 
 import pytest
 from syrupy.assertion import SnapshotAssertion
-from typer.testing import CliRunner
 
-from altamisa.apps import isatab2dot, isatab2isatab, isatab_validate
 from altamisa.exceptions import IsaWarning
 
-runner = CliRunner()
+# The apps (and typer) are only imported by the tests using them, which keeps them out of
+# test collection and of runs selecting other tests.
+
+
+# Helper to invoke an app's command line interface
+def _invoke(app, argv):
+    from typer.testing import CliRunner
+
+    return CliRunner().invoke(app, argv)
 
 
 def test_isatab_validate(snapshot: SnapshotAssertion):
+    from altamisa.apps import isatab_validate
+
     i_file = os.path.join(os.path.dirname(__file__), "data", "i_warnings", "i_warnings.txt")
     argv = ["--input-investigation-file", i_file, "--show-duplicate-warnings"]
 
     with pytest.warns(IsaWarning) as record:
-        result = runner.invoke(isatab_validate.app, argv)
+        result = _invoke(isatab_validate.app, argv)
         assert result.exit_code == 0
 
     assert snapshot == [str(r.message) for r in record]
 
 
-def test_isatab2isatab(tmpdir, snapshot: SnapshotAssertion):
+def test_isatab2isatab(tmp_path, snapshot: SnapshotAssertion):
+    from altamisa.apps import isatab2isatab
+
     i_file = os.path.join(os.path.dirname(__file__), "data", "i_minimal", "i_minimal.txt")
     argv = [
         "--input-investigation-file",
         i_file,
         "--output-investigation-file",
-        str(tmpdir.mkdir("i_minimal").join("i_minimal.txt")),
+        str(tmp_path / "i_minimal.txt"),
         "--quotes",
         '"',
     ]
 
     with pytest.warns(IsaWarning) as record:
-        result = runner.invoke(isatab2isatab.app, argv)
+        result = _invoke(isatab2isatab.app, argv)
         assert result.exit_code == 0
 
     assert snapshot == [str(r.message) for r in record]
 
 
-def test_isatab2isatab_input_is_output(tmpdir, snapshot: SnapshotAssertion):
+def test_isatab2isatab_input_is_output(snapshot: SnapshotAssertion):
+    from altamisa.apps import isatab2isatab
+
     i_file = os.path.join(os.path.dirname(__file__), "data", "i_minimal", "i_minimal.txt")
     argv = [
         "--input-investigation-file",
@@ -53,21 +65,23 @@ def test_isatab2isatab_input_is_output(tmpdir, snapshot: SnapshotAssertion):
         '"',
     ]
 
-    result = runner.invoke(isatab2isatab.app, argv)
+    result = _invoke(isatab2isatab.app, argv)
     assert result.exit_code == 1
     assert snapshot == str(result).replace(
         os.path.dirname(__file__), "/home/runner/work/altamisa/tests"
     )
 
 
-def test_isatab2dot(tmpdir):
+def test_isatab2dot(tmp_path):
+    from altamisa.apps import isatab2dot
+
     i_file = os.path.join(os.path.dirname(__file__), "data", "i_minimal", "i_minimal.txt")
     argv = [
         "--investigation-file",
         i_file,
         "--output-file",
-        str(tmpdir.mkdir("dot").join("out.dot")),
+        str(tmp_path / "out.dot"),
     ]
 
-    result = runner.invoke(isatab2dot.app, argv)
+    result = _invoke(isatab2dot.app, argv)
     assert result.exit_code == 0
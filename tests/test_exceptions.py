@@ -10,51 +10,53 @@ from altamisa.isatab import AssayReader, InvestigationReader
 # Test header exceptions ---------------------------------------------------------------------------
 
 
-def test_header_exception_simple_header_not_allowed(assay_file_exception_simple_header_not_allowed):
+@pytest.mark.parametrize(
+    "fixture_name,msg",
+    [
+        (
+            "assay_file_exception_simple_header_not_allowed",
+            'Header "Source Name" not allowed in assay.',
+        ),
+        (
+            "assay_file_exception_labeled_header_not_allowed",
+            'Header "Factor Value" not allowed in assay.',
+        ),
+        (
+            "assay_file_exception_unknown_header",
+            'Header "Test Name" unknown, processing unclear',
+        ),
+        (
+            "assay_file_exception_term_source_ref_next_column",
+            'Expected column "Term Accession Number" after seeing "Term Source REF"',
+        ),
+        (
+            "assay_file_exception_term_source_ref_stop_iteration",
+            'Expected one more column on seeing "Term Source REF"',
+        ),
+        (
+            "assay_file_exception_labeled_header_format",
+            "Problem parsing labeled header CharacteristicsWithoutBrackets",
+        ),
+        (
+            "assay_file_exception_duplicated_header",
+            "Found duplicated column types in header of study S1 assay A1: "
+            "Characteristics[Organism]",
+        ),
+    ],
+    ids=[
+        "simple_header_not_allowed",
+        "labeled_header_not_allowed",
+        "unknown_header",
+        "term_source_ref_next_column",
+        "term_source_ref_stop_iteration",
+        "labeled_header_format",
+        "duplicated_header",
+    ],
+)
+def test_header_exception_assay(request, fixture_name, msg):
+    assay_file = request.getfixturevalue(fixture_name)
     with pytest.raises(ParseIsatabException) as excinfo:
-        AssayReader.from_stream("S1", "A1", assay_file_exception_simple_header_not_allowed)
-    msg = 'Header "Source Name" not allowed in assay.'
-    assert msg == str(excinfo.value)
-
-
-def test_header_exception_labeled_header_not_allowed(
-    assay_file_exception_labeled_header_not_allowed,
-):
-    with pytest.raises(ParseIsatabException) as excinfo:
-        AssayReader.from_stream("S1", "A1", assay_file_exception_labeled_header_not_allowed)
-    msg = 'Header "Factor Value" not allowed in assay.'
-    assert msg == str(excinfo.value)
-
-
-def test_header_exception_unknown_header(assay_file_exception_unknown_header):
-    with pytest.raises(ParseIsatabException) as excinfo:
-        AssayReader.from_stream("S1", "A1", assay_file_exception_unknown_header)
-    msg = 'Header "Test Name" unknown, processing unclear'
-    assert msg == str(excinfo.value)
-
-
-def test_header_exception_term_source_ref_next_column(
-    assay_file_exception_term_source_ref_next_column,
-):
-    with pytest.raises(ParseIsatabException) as excinfo:
-        AssayReader.from_stream("S1", "A1", assay_file_exception_term_source_ref_next_column)
-    msg = 'Expected column "Term Accession Number" after seeing "Term Source REF"'
-    assert msg == str(excinfo.value)
-
-
-def test_header_exception_term_source_ref_stop_iteration(
-    assay_file_exception_term_source_ref_stop_iteration,
-):
-    with pytest.raises(ParseIsatabException) as excinfo:
-        AssayReader.from_stream("S1", "A1", assay_file_exception_term_source_ref_stop_iteration)
-    msg = 'Expected one more column on seeing "Term Source REF"'
-    assert msg == str(excinfo.value)
-
-
-def test_header_exception_labeled_header_format(assay_file_exception_labeled_header_format):
-    with pytest.raises(ParseIsatabException) as excinfo:
-        AssayReader.from_stream("S1", "A1", assay_file_exception_labeled_header_format)
-    msg = "Problem parsing labeled header CharacteristicsWithoutBrackets"
+        AssayReader.from_stream("S1", "A1", assay_file).read()
     assert msg == str(excinfo.value)
 
 
@@ -65,13 +67,6 @@ def test_header_exception_investigation_comment_format(investigation_file_except
     assert msg == str(excinfo.value)
 
 
-def test_header_exception_duplicated_header(assay_file_exception_duplicated_header):
-    with pytest.raises(ParseIsatabException) as excinfo:
-        AssayReader.from_stream("S1", "A1", assay_file_exception_duplicated_header).read()
-    msg = "Found duplicated column types in header of study S1 assay A1: Characteristics[Organism]"
-    assert msg == str(excinfo.value)
-
-
 # Test assay and study parsing exceptions ----------------------------------------------------------
 
 
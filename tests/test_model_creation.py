@@ -3,15 +3,29 @@
 
 import warnings
 
+import pytest
+
 from docs.examples import create_isa_model
 
 
-def test_minimal_model_creation(tmp_path):
+@pytest.fixture(scope="module")
+def minimal_model_creation(tmp_path_factory):
+    """Create and write the minimal model once, return output directory and recorded warnings"""
+    path = tmp_path_factory.mktemp("minimal_model")
     with warnings.catch_warnings(record=True) as records:
-        create_isa_model.create_and_write(str(tmp_path))
+        create_isa_model.create_and_write(str(path))
+    return path, records
+
+
+def test_minimal_model_creation_files(minimal_model_creation):
+    path, _ = minimal_model_creation
+
+    assert (path / "i_minimal.txt").exists()
+    assert (path / "s_minimal.txt").exists()
+    assert (path / "a_minimal.txt").exists()
+
 
-    assert (tmp_path / "i_minimal.txt").exists()
-    assert (tmp_path / "s_minimal.txt").exists()
-    assert (tmp_path / "a_minimal.txt").exists()
+def test_minimal_model_creation_warnings(minimal_model_creation):
+    _, records = minimal_model_creation
 
     assert 13 == len(records)
@@ -19,667 +19,310 @@ from altamisa.isatab import (
     models,
 )
 
+# Normalized expected path suffixes of the assay files
+_MINIMAL_ASSAY_PATH = os.path.normpath("data/i_minimal/a_minimal.txt")
+_SMALL_ASSAY_PATH = os.path.normpath("data/i_small/a_small.txt")
+_SMALL2_ASSAY_PATH = os.path.normpath("data/i_small2/a_small2.txt")
+_GELELECT_ASSAY_PATH = os.path.normpath(
+    "data/test_gelelect/a_study01_protein_expression_profiling_gel_electrophoresis.txt"
+)
 
-def test_assay_row_reader_minimal_assay(
-    minimal_investigation_file: TextIO, minimal_assay_file: TextIO
-):
-    """Use ``AssayRowReader`` to read in minimal assay file."""
-
-    # Create new row reader and check read headers
-    row_reader = AssayRowReader.from_stream("S1", "A1", minimal_assay_file)
-    assert 5 == len(row_reader.header)
-
-    # Read all rows in assay
-    rows = list(row_reader.read())
-
-    # Check results
-    assert 1 == len(rows)
-    first_row = rows[0]
-
-    assert 4 == len(first_row)
-
-    expected = models.Material(
-        "Sample Name",
-        "S1-sample-0815-N1",
-        "0815-N1",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.SAMPLE_NAME],
-    )
-    assert expected == first_row[0]
-    expected = models.Process(
-        "nucleic acid sequencing",
-        "S1-A1-0815-N1-DNA1-WES1-3",
-        "0815-N1-DNA1-WES1",
-        "Assay Name",
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.PROTOCOL_REF, table_headers.ASSAY_NAME],
-    )
-    assert expected == first_row[1]
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL4",
-        "0815-N1-DNA1-WES1_L???_???_R1.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == first_row[2]
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL5",
-        "0815-N1-DNA1-WES1_L???_???_R2.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == first_row[3]
-
-
-def test_assay_reader_minimal_assay(minimal_investigation_file: TextIO, minimal_assay_file: TextIO):
-    """Use ``AssayReader`` to read in minimal assay file.
-
-    Using the ``AssayReader`` instead of the ``AssayRowReader`` gives us
-    ``Assay`` objects instead of just the row-wise nodes.
-    """
-    # Load investigation (tested elsewhere)
-    investigation = InvestigationReader.from_stream(minimal_investigation_file).read()
-    with pytest.warns(IsaWarning) as record:
-        InvestigationValidator(investigation).validate()
-
-    # Check warnings
-    assert 2 == len(record)
-
-    # Create new row reader and check read headers
-    reader = AssayReader.from_stream("S1", "A1", minimal_assay_file)
-    assert 5 == len(reader.header)
-
-    # Read and validate assay
-    assay = reader.read()
-    AssayValidator(
-        investigation, investigation.studies[0], investigation.studies[0].assays[0], assay
-    ).validate()
-
-    # Check results
-    assert os.path.normpath(str(assay.file)).endswith(
-        os.path.normpath("data/i_minimal/a_minimal.txt")
-    )
-    assert 5 == len(assay.header)
-    assert 3 == len(assay.materials)
-    assert 1 == len(assay.processes)
-    assert 3 == len(assay.arcs)
-
-    expected = models.Material(
-        "Sample Name",
-        "S1-sample-0815-N1",
-        "0815-N1",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.SAMPLE_NAME],
-    )
-    assert expected == assay.materials["S1-sample-0815-N1"]
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL4",
-        "0815-N1-DNA1-WES1_L???_???_R1.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == assay.materials["S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL4"]
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL5",
-        "0815-N1-DNA1-WES1_L???_???_R2.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == assay.materials["S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL5"]
-
-    expected = models.Process(
-        "nucleic acid sequencing",
-        "S1-A1-0815-N1-DNA1-WES1-3",
-        "0815-N1-DNA1-WES1",
-        "Assay Name",
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.PROTOCOL_REF, table_headers.ASSAY_NAME],
-    )
-    assert expected == assay.processes["S1-A1-0815-N1-DNA1-WES1-3"]
-
-    expected = (
-        models.Arc("S1-sample-0815-N1", "S1-A1-0815-N1-DNA1-WES1-3"),
-        models.Arc(
-            "S1-A1-0815-N1-DNA1-WES1-3", "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL4"
-        ),
-        models.Arc(
-            "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL4",
-            "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL5",
-        ),
-    )
-    assert expected == assay.arcs
-
-
-def test_assay_row_reader_small_assay(small_investigation_file: TextIO, small_assay_file: TextIO):
-    """Use ``AssayRowReader`` to read in small assay file."""
-
-    # Create new row reader and check read headers
-    row_reader = AssayRowReader.from_stream("S1", "A1", small_assay_file)
-    assert 9 == len(row_reader.header)
-
-    # Read all rows in assay
-    rows = list(row_reader.read())
-
-    # Check results
-    assert 2 == len(rows)
-    first_row = rows[0]
-    second_row = rows[1]
-
-    assert 8 == len(first_row)
-
-    expected = models.Material(
-        "Sample Name",
-        "S1-sample-0815-N1",
-        "0815-N1",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.SAMPLE_NAME],
-    )
-    assert expected == first_row[0]
-
-    expected = models.Process(
-        "library preparation",
-        "S1-A1-library preparation-2-1",
-        None,
-        None,
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.PROTOCOL_REF],
-    )
-    assert expected == first_row[1]
-
-    expected = models.Material(
-        "Library Name",
-        "S1-A1-0815-N1-DNA1-COL3",
-        "0815-N1-DNA1",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.LIBRARY_NAME],
-    )
-    assert expected == first_row[2]
-
-    expected = models.Process(
-        "nucleic acid sequencing",
-        "S1-A1-0815-N1-DNA1-WES1-5",
-        "0815-N1-DNA1-WES1",
-        "Assay Name",
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.PROTOCOL_REF, table_headers.ASSAY_NAME],
-    )
-    assert expected == first_row[3]
-
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL6",
-        "0815-N1-DNA1-WES1_L???_???_R1.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == first_row[4]
-
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL7",
-        "0815-N1-DNA1-WES1_L???_???_R2.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == first_row[5]
-
-    expected = models.Process(
-        "Unknown",
-        "S1-A1-somatic variant calling-1-8",
-        "somatic variant calling-1",
-        "Data Transformation Name",
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.DATA_TRANSFORMATION_NAME],
-    )
-    assert expected == first_row[6]
-
-    expected = models.Material(
-        "Derived Data File",
-        "S1-A1-0815-somatic.vcf.gz-COL9",
-        "0815-somatic.vcf.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.DERIVED_DATA_FILE],
-    )
-    assert expected == first_row[7]
-
-    assert 8 == len(second_row)
-
-    expected = models.Material(
-        "Sample Name",
-        "S1-sample-0815-T1",
-        "0815-T1",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.SAMPLE_NAME],
-    )
-    assert expected == second_row[0]
-
-    expected = models.Process(
-        "library preparation",
-        "S1-A1-library preparation-2-2",
-        None,
-        None,
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.PROTOCOL_REF],
-    )
-    assert expected == second_row[1]
-
-    expected = models.Material(
-        "Library Name",
-        "S1-A1-0815-T1-DNA1-COL3",
-        "0815-T1-DNA1",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.LIBRARY_NAME],
-    )
-    assert expected == second_row[2]
-
-    expected = models.Process(
-        "nucleic acid sequencing",
-        "S1-A1-0815-T1-DNA1-WES1-5",
-        "0815-T1-DNA1-WES1",
-        "Assay Name",
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.PROTOCOL_REF, table_headers.ASSAY_NAME],
-    )
-    assert expected == second_row[3]
-
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-T1-DNA1-WES1_L???_???_R1.fastq.gz-COL6",
-        "0815-T1-DNA1-WES1_L???_???_R1.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == second_row[4]
-
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-T1-DNA1-WES1_L???_???_R2.fastq.gz-COL7",
-        "0815-T1-DNA1-WES1_L???_???_R2.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == second_row[5]
-
-    expected = models.Process(
-        "Unknown",
-        "S1-A1-somatic variant calling-1-8",
-        "somatic variant calling-1",
-        "Data Transformation Name",
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.DATA_TRANSFORMATION_NAME],
-    )
-    assert expected == second_row[6]
-
-    expected = models.Material(
-        "Derived Data File",
-        "S1-A1-0815-somatic.vcf.gz-COL9",
-        "0815-somatic.vcf.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.DERIVED_DATA_FILE],
-    )
-    assert expected == second_row[7]
-
-
-def test_assay_reader_small_assay(small_investigation_file: TextIO, small_assay_file: TextIO):
-    """Use ``AssayReader`` to read in small assay file."""
-    # Load investigation (tested elsewhere)
-    investigation = InvestigationReader.from_stream(small_investigation_file).read()
-    with pytest.warns(IsaWarning) as record:
-        InvestigationValidator(investigation).validate()
-
-    # Check warnings
-    assert 2 == len(record)
-
-    # Create new row reader and check read headers
-    reader = AssayReader.from_stream("S1", "A1", small_assay_file)
-    assert 9 == len(reader.header)
-
-    # Read assay
-    with pytest.warns(IsaWarning) as record:
-        assay = reader.read()
-        AssayValidator(
-            investigation, investigation.studies[0], investigation.studies[0].assays[0], assay
-        ).validate()
-
-    # Check warnings
-    assert 1 == len(record)
-
-    # Check results
-    assert os.path.normpath(str(assay.file)).endswith(os.path.normpath("data/i_small/a_small.txt"))
-    assert 9 == len(assay.header)
-    assert 9 == len(assay.materials)
-    assert 5 == len(assay.processes)
-    assert 13 == len(assay.arcs)
-
-    expected = models.Material(
-        "Sample Name",
-        "S1-sample-0815-N1",
-        "0815-N1",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.SAMPLE_NAME],
-    )
-    assert expected == assay.materials["S1-sample-0815-N1"]
-    expected = models.Material(
-        "Sample Name",
-        "S1-sample-0815-T1",
-        "0815-T1",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.SAMPLE_NAME],
-    )
-    assert expected == assay.materials["S1-sample-0815-T1"]
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL6",
-        "0815-N1-DNA1-WES1_L???_???_R1.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == assay.materials["S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL6"]
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL7",
-        "0815-N1-DNA1-WES1_L???_???_R2.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == assay.materials["S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL7"]
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-T1-DNA1-WES1_L???_???_R1.fastq.gz-COL6",
-        "0815-T1-DNA1-WES1_L???_???_R1.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == assay.materials["S1-A1-0815-T1-DNA1-WES1_L???_???_R1.fastq.gz-COL6"]
-    expected = models.Material(
-        "Raw Data File",
-        "S1-A1-0815-T1-DNA1-WES1_L???_???_R2.fastq.gz-COL7",
-        "0815-T1-DNA1-WES1_L???_???_R2.fastq.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.RAW_DATA_FILE],
-    )
-    assert expected == assay.materials["S1-A1-0815-T1-DNA1-WES1_L???_???_R2.fastq.gz-COL7"]
-    expected = models.Material(
-        "Derived Data File",
-        "S1-A1-0815-somatic.vcf.gz-COL9",
-        "0815-somatic.vcf.gz",
-        None,
-        (),
-        (),
-        (),
-        None,
-        [table_headers.DERIVED_DATA_FILE],
-    )
-    assert expected == assay.materials["S1-A1-0815-somatic.vcf.gz-COL9"]
-
-    expected = models.Process(
-        "library preparation",
-        "S1-A1-library preparation-2-1",
-        None,
-        None,
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.PROTOCOL_REF],
-    )
-    assert expected == assay.processes["S1-A1-library preparation-2-1"]
-    expected = models.Process(
-        "library preparation",
-        "S1-A1-library preparation-2-2",
-        None,
-        None,
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.PROTOCOL_REF],
-    )
-    assert expected == assay.processes["S1-A1-library preparation-2-2"]
-    expected = models.Process(
-        "nucleic acid sequencing",
-        "S1-A1-0815-N1-DNA1-WES1-5",
-        "0815-N1-DNA1-WES1",
-        "Assay Name",
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.PROTOCOL_REF, table_headers.ASSAY_NAME],
-    )
-    assert expected == assay.processes["S1-A1-0815-N1-DNA1-WES1-5"]
-    expected = models.Process(
-        "nucleic acid sequencing",
-        "S1-A1-0815-T1-DNA1-WES1-5",
-        "0815-T1-DNA1-WES1",
-        "Assay Name",
-        None,
-        None,
-        (),
-        (),
-        None,
-        None,
-        None,
-        [table_headers.PROTOCOL_REF, table_headers.ASSAY_NAME],
-    )
-    assert expected == assay.processes["S1-A1-0815-T1-DNA1-WES1-5"]
-
-    expected = (
-        models.Arc("S1-sample-0815-N1", "S1-A1-library preparation-2-1"),
-        models.Arc("S1-A1-library preparation-2-1", "S1-A1-0815-N1-DNA1-COL3"),
-        models.Arc("S1-A1-0815-N1-DNA1-COL3", "S1-A1-0815-N1-DNA1-WES1-5"),
-        models.Arc(
-            "S1-A1-0815-N1-DNA1-WES1-5", "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL6"
-        ),
-        models.Arc(
-            "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL6",
-            "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL7",
-        ),
-        models.Arc(
-            "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL7", "S1-A1-somatic variant calling-1-8"
-        ),
-        models.Arc("S1-A1-somatic variant calling-1-8", "S1-A1-0815-somatic.vcf.gz-COL9"),
-        models.Arc("S1-sample-0815-T1", "S1-A1-library preparation-2-2"),
-        models.Arc("S1-A1-library preparation-2-2", "S1-A1-0815-T1-DNA1-COL3"),
-        models.Arc("S1-A1-0815-T1-DNA1-COL3", "S1-A1-0815-T1-DNA1-WES1-5"),
-        models.Arc(
-            "S1-A1-0815-T1-DNA1-WES1-5", "S1-A1-0815-T1-DNA1-WES1_L???_???_R1.fastq.gz-COL6"
-        ),
-        models.Arc(
-            "S1-A1-0815-T1-DNA1-WES1_L???_???_R1.fastq.gz-COL6",
-            "S1-A1-0815-T1-DNA1-WES1_L???_???_R2.fastq.gz-COL7",
-        ),
-        models.Arc(
-            "S1-A1-0815-T1-DNA1-WES1_L???_???_R2.fastq.gz-COL7", "S1-A1-somatic variant calling-1-8"
-        ),
-    )
-    assert expected == assay.arcs
 
+# Expected nodes shared by several tests
+_SAMPLE_0815_N1 = models.Material(
+    "Sample Name",
+    "S1-sample-0815-N1",
+    "0815-N1",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.SAMPLE_NAME],
+)
+_SEQUENCING_0815_N1_COL3 = models.Process(
+    "nucleic acid sequencing",
+    "S1-A1-0815-N1-DNA1-WES1-3",
+    "0815-N1-DNA1-WES1",
+    "Assay Name",
+    None,
+    None,
+    (),
+    (),
+    None,
+    None,
+    None,
+    [table_headers.PROTOCOL_REF, table_headers.ASSAY_NAME],
+)
+_RAW_0815_N1_R1_COL4 = models.Material(
+    "Raw Data File",
+    "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL4",
+    "0815-N1-DNA1-WES1_L???_???_R1.fastq.gz",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.RAW_DATA_FILE],
+)
+_RAW_0815_N1_R2_COL5 = models.Material(
+    "Raw Data File",
+    "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL5",
+    "0815-N1-DNA1-WES1_L???_???_R2.fastq.gz",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.RAW_DATA_FILE],
+)
+_LIBRARY_PREPARATION_COL2_1 = models.Process(
+    "library preparation",
+    "S1-A1-library preparation-2-1",
+    None,
+    None,
+    None,
+    None,
+    (),
+    (),
+    None,
+    None,
+    None,
+    [table_headers.PROTOCOL_REF],
+)
+_LIBRARY_0815_N1_COL3 = models.Material(
+    "Library Name",
+    "S1-A1-0815-N1-DNA1-COL3",
+    "0815-N1-DNA1",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.LIBRARY_NAME],
+)
 
-def test_assay_reader_small2_assay(small2_investigation_file: TextIO, small2_assay_file: TextIO):
-    """Use ``AssayReader`` to read in small assay file."""
-    # Load investigation (tested elsewhere)
-    investigation = InvestigationReader.from_stream(small2_investigation_file).read()
-    with pytest.warns(IsaWarning) as record:
-        InvestigationValidator(investigation).validate()
+_SEQUENCING_0815_N1_COL5 = models.Process(
+    "nucleic acid sequencing",
+    "S1-A1-0815-N1-DNA1-WES1-5",
+    "0815-N1-DNA1-WES1",
+    "Assay Name",
+    None,
+    None,
+    (),
+    (),
+    None,
+    None,
+    None,
+    [table_headers.PROTOCOL_REF, table_headers.ASSAY_NAME],
+)
+_RAW_0815_N1_R1_COL6 = models.Material(
+    "Raw Data File",
+    "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL6",
+    "0815-N1-DNA1-WES1_L???_???_R1.fastq.gz",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.RAW_DATA_FILE],
+)
+_RAW_0815_N1_R2_COL7 = models.Material(
+    "Raw Data File",
+    "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL7",
+    "0815-N1-DNA1-WES1_L???_???_R2.fastq.gz",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.RAW_DATA_FILE],
+)
+_VARIANT_CALLING_COL8 = models.Process(
+    "Unknown",
+    "S1-A1-somatic variant calling-1-8",
+    "somatic variant calling-1",
+    "Data Transformation Name",
+    None,
+    None,
+    (),
+    (),
+    None,
+    None,
+    None,
+    [table_headers.DATA_TRANSFORMATION_NAME],
+)
+_SOMATIC_VCF_COL9 = models.Material(
+    "Derived Data File",
+    "S1-A1-0815-somatic.vcf.gz-COL9",
+    "0815-somatic.vcf.gz",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.DERIVED_DATA_FILE],
+)
+_SAMPLE_0815_T1 = models.Material(
+    "Sample Name",
+    "S1-sample-0815-T1",
+    "0815-T1",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.SAMPLE_NAME],
+)
+_LIBRARY_PREPARATION_COL2_2 = models.Process(
+    "library preparation",
+    "S1-A1-library preparation-2-2",
+    None,
+    None,
+    None,
+    None,
+    (),
+    (),
+    None,
+    None,
+    None,
+    [table_headers.PROTOCOL_REF],
+)
+_LIBRARY_0815_T1_COL3 = models.Material(
+    "Library Name",
+    "S1-A1-0815-T1-DNA1-COL3",
+    "0815-T1-DNA1",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.LIBRARY_NAME],
+)
 
-    # Check warnings
-    assert 1 == len(record)
+_SEQUENCING_0815_T1_COL5 = models.Process(
+    "nucleic acid sequencing",
+    "S1-A1-0815-T1-DNA1-WES1-5",
+    "0815-T1-DNA1-WES1",
+    "Assay Name",
+    None,
+    None,
+    (),
+    (),
+    None,
+    None,
+    None,
+    [table_headers.PROTOCOL_REF, table_headers.ASSAY_NAME],
+)
+_RAW_0815_T1_R1_COL6 = models.Material(
+    "Raw Data File",
+    "S1-A1-0815-T1-DNA1-WES1_L???_???_R1.fastq.gz-COL6",
+    "0815-T1-DNA1-WES1_L???_???_R1.fastq.gz",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.RAW_DATA_FILE],
+)
+_RAW_0815_T1_R2_COL7 = models.Material(
+    "Raw Data File",
+    "S1-A1-0815-T1-DNA1-WES1_L???_???_R2.fastq.gz-COL7",
+    "0815-T1-DNA1-WES1_L???_???_R2.fastq.gz",
+    None,
+    (),
+    (),
+    (),
+    None,
+    [table_headers.RAW_DATA_FILE],
+)
 
-    # Create new row reader and check read headers
-    reader = AssayReader.from_stream("S1", "A1", small2_assay_file)
-    assert 14 == len(reader.header)
 
-    # Read assay
-    assay = reader.read()
-    AssayValidator(
-        investigation, investigation.studies[0], investigation.studies[0].assays[0], assay
-    ).validate()
+# Expected nodes of the minimal and small assays, keyed by unique name
+_MINIMAL_MATERIALS = {
+    m.unique_name: m for m in (_SAMPLE_0815_N1, _RAW_0815_N1_R1_COL4, _RAW_0815_N1_R2_COL5)
+}
+_MINIMAL_PROCESSES = {p.unique_name: p for p in (_SEQUENCING_0815_N1_COL3,)}
+
+_SMALL_MATERIALS = {
+    m.unique_name: m
+    for m in (
+        _SAMPLE_0815_N1,
+        _SAMPLE_0815_T1,
+        _LIBRARY_0815_N1_COL3,
+        _LIBRARY_0815_T1_COL3,
+        _RAW_0815_N1_R1_COL6,
+        _RAW_0815_N1_R2_COL7,
+        _RAW_0815_T1_R1_COL6,
+        _RAW_0815_T1_R2_COL7,
+        _SOMATIC_VCF_COL9,
+    )
+}
+_SMALL_PROCESSES = {
+    p.unique_name: p
+    for p in (
+        _LIBRARY_PREPARATION_COL2_1,
+        _LIBRARY_PREPARATION_COL2_2,
+        _SEQUENCING_0815_N1_COL5,
+        _SEQUENCING_0815_T1_COL5,
+        _VARIANT_CALLING_COL8,
+    )
+}
+
+
+# Expected arcs of the minimal and small assays (in file order)
+_MINIMAL_ARCS = (
+    models.Arc("S1-sample-0815-N1", "S1-A1-0815-N1-DNA1-WES1-3"),
+    models.Arc("S1-A1-0815-N1-DNA1-WES1-3", "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL4"),
+    models.Arc(
+        "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL4",
+        "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL5",
+    ),
+)
 
-    # Check results
-    assert os.path.normpath(str(assay.file)).endswith(
-        os.path.normpath("data/i_small2/a_small2.txt")
-    )
-    assert 14 == len(assay.header)
-    assert 25 == len(assay.materials)
-    assert 41 == len(assay.processes)
-    assert 74 == len(assay.arcs)
+_SMALL_ARCS = (
+    models.Arc("S1-sample-0815-N1", "S1-A1-library preparation-2-1"),
+    models.Arc("S1-A1-library preparation-2-1", "S1-A1-0815-N1-DNA1-COL3"),
+    models.Arc("S1-A1-0815-N1-DNA1-COL3", "S1-A1-0815-N1-DNA1-WES1-5"),
+    models.Arc("S1-A1-0815-N1-DNA1-WES1-5", "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL6"),
+    models.Arc(
+        "S1-A1-0815-N1-DNA1-WES1_L???_???_R1.fastq.gz-COL6",
+        "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL7",
+    ),
+    models.Arc(
+        "S1-A1-0815-N1-DNA1-WES1_L???_???_R2.fastq.gz-COL7", "S1-A1-somatic variant calling-1-8"
+    ),
+    models.Arc("S1-A1-somatic variant calling-1-8", "S1-A1-0815-somatic.vcf.gz-COL9"),
+    models.Arc("S1-sample-0815-T1", "S1-A1-library preparation-2-2"),
+    models.Arc("S1-A1-library preparation-2-2", "S1-A1-0815-T1-DNA1-COL3"),
+    models.Arc("S1-A1-0815-T1-DNA1-COL3", "S1-A1-0815-T1-DNA1-WES1-5"),
+    models.Arc("S1-A1-0815-T1-DNA1-WES1-5", "S1-A1-0815-T1-DNA1-WES1_L???_???_R1.fastq.gz-COL6"),
+    models.Arc(
+        "S1-A1-0815-T1-DNA1-WES1_L???_???_R1.fastq.gz-COL6",
+        "S1-A1-0815-T1-DNA1-WES1_L???_???_R2.fastq.gz-COL7",
+    ),
+    models.Arc(
+        "S1-A1-0815-T1-DNA1-WES1_L???_???_R2.fastq.gz-COL7", "S1-A1-somatic variant calling-1-8"
+    ),
+)
 
-    # Comments
-    expected = models.Comment(name="Replicate", value="B")
-    assert assay.materials["S1-A1-0815-T1-Pro1-B-115-COL5"].comments[0] == expected
 
-    # Expected arcs
-    expected = (
+# Expected headers of the gel electrophoresis processes (the parser stores headers as lists)
+_HEADER_ELECTROPHORESIS = [
+    table_headers.PROTOCOL_REF,
+    table_headers.GEL_ELECTROPHORESIS_ASSAY_NAME,
+    table_headers.FIRST_DIMENSION,
+    table_headers.TERM_SOURCE_REF,
+    table_headers.TERM_ACCESSION_NUMBER,
+    table_headers.SECOND_DIMENSION,
+    table_headers.TERM_SOURCE_REF,
+    table_headers.TERM_ACCESSION_NUMBER,
+]
+
+
+# Expected arcs of the small2 assay (hashed once at import)
+_SMALL2_ARCS = frozenset(
+    (
         models.Arc("S1-sample-0815-N1", "S1-A1-extraction-2-1"),
         models.Arc("S1-sample-0815-T1", "S1-A1-extraction-2-2"),
         models.Arc("S1-A1-extraction-2-1", "S1-A1-0815-N1-Pro1-COL3"),
@@ -755,35 +398,194 @@ def test_assay_reader_small2_assay(small2_investigation_file: TextIO, small2_ass
         models.Arc("S1-A1-data transformation-12-9", "S1-A1-Empty Derived Data File-14-9"),
         models.Arc("S1-A1-data analysis-13", "S1-A1-results.csv-COL14"),
     )
-    assert sorted(expected) == sorted(assay.arcs)
+)
+
+
+def test_assay_row_reader_minimal_assay(
+    minimal_investigation_file: TextIO, minimal_assay_file: TextIO
+):
+    """Use ``AssayRowReader`` to read in minimal assay file."""
+
+    # Create new row reader and check read headers
+    row_reader = AssayRowReader.from_stream("S1", "A1", minimal_assay_file)
+    assert 5 == len(row_reader.header)
+
+    # Read all rows in assay
+    rows = list(row_reader.read())
+
+    # Check results
+    expected = [
+        [_SAMPLE_0815_N1, _SEQUENCING_0815_N1_COL3, _RAW_0815_N1_R1_COL4, _RAW_0815_N1_R2_COL5],
+    ]
+    assert expected == rows
+
+
+def test_assay_reader_minimal_assay(
+    minimal_investigation: models.InvestigationInfo, minimal_assay_file: TextIO
+):
+    """Use ``AssayReader`` to read in minimal assay file.
+
+    Using the ``AssayReader`` instead of the ``AssayRowReader`` gives us
+    ``Assay`` objects instead of just the row-wise nodes.
+    """
+    investigation = minimal_investigation
+    with pytest.warns(IsaWarning) as record:
+        InvestigationValidator(investigation).validate()
+
+    # Check warnings
+    assert 2 == len(record)
+
+    # Create new row reader and check read headers
+    reader = AssayReader.from_stream("S1", "A1", minimal_assay_file)
+    assert 5 == len(reader.header)
+
+    # Read and validate assay
+    assay = reader.read()
+    AssayValidator(
+        investigation, investigation.studies[0], investigation.studies[0].assays[0], assay
+    ).validate()
+
+    # Check results
+    assert os.path.normpath(str(assay.file)).endswith(_MINIMAL_ASSAY_PATH)
+    assert 5 == len(assay.header)
+    assert _MINIMAL_MATERIALS == assay.materials
+    assert _MINIMAL_PROCESSES == assay.processes
+    assert _MINIMAL_ARCS == assay.arcs
+
+
+def test_assay_row_reader_small_assay(small_investigation_file: TextIO, small_assay_file: TextIO):
+    """Use ``AssayRowReader`` to read in small assay file."""
+
+    # Create new row reader and check read headers
+    row_reader = AssayRowReader.from_stream("S1", "A1", small_assay_file)
+    assert 9 == len(row_reader.header)
+
+    # Read all rows in assay
+    rows = list(row_reader.read())
+
+    # Check results
+    expected_first_row = [
+        _SAMPLE_0815_N1,
+        _LIBRARY_PREPARATION_COL2_1,
+        _LIBRARY_0815_N1_COL3,
+        _SEQUENCING_0815_N1_COL5,
+        _RAW_0815_N1_R1_COL6,
+        _RAW_0815_N1_R2_COL7,
+        _VARIANT_CALLING_COL8,
+        _SOMATIC_VCF_COL9,
+    ]
+    expected_second_row = [
+        _SAMPLE_0815_T1,
+        _LIBRARY_PREPARATION_COL2_2,
+        _LIBRARY_0815_T1_COL3,
+        _SEQUENCING_0815_T1_COL5,
+        _RAW_0815_T1_R1_COL6,
+        _RAW_0815_T1_R2_COL7,
+        _VARIANT_CALLING_COL8,
+        _SOMATIC_VCF_COL9,
+    ]
+    assert [expected_first_row, expected_second_row] == rows
+
+
+def test_assay_reader_small_assay(
+    small_investigation: models.InvestigationInfo, small_assay_file: TextIO
+):
+    """Use ``AssayReader`` to read in small assay file."""
+    investigation = small_investigation
+    with pytest.warns(IsaWarning) as record:
+        InvestigationValidator(investigation).validate()
+
+    # Check warnings
+    assert 2 == len(record)
+
+    # Create new row reader and check read headers
+    reader = AssayReader.from_stream("S1", "A1", small_assay_file)
+    assert 9 == len(reader.header)
+
+    # Read assay
+    assay = reader.read()
+
+    # Validate assay
+    with pytest.warns(IsaWarning) as record:
+        AssayValidator(
+            investigation, investigation.studies[0], investigation.studies[0].assays[0], assay
+        ).validate()
+
+    # Check warnings
+    assert 1 == len(record)
+
+    # Check results
+    assert os.path.normpath(str(assay.file)).endswith(_SMALL_ASSAY_PATH)
+    assert 9 == len(assay.header)
+    assert _SMALL_MATERIALS == assay.materials
+    assert _SMALL_PROCESSES == assay.processes
+    assert _SMALL_ARCS == assay.arcs
+
+
+def test_assay_reader_small2_assay(
+    small2_investigation: models.InvestigationInfo, small2_assay_file: TextIO
+):
+    """Use ``AssayReader`` to read in small assay file."""
+    investigation = small2_investigation
+    with pytest.warns(IsaWarning) as record:
+        InvestigationValidator(investigation).validate()
+
+    # Check warnings
+    assert 1 == len(record)
+
+    # Create new row reader and check read headers
+    reader = AssayReader.from_stream("S1", "A1", small2_assay_file)
+    assert 14 == len(reader.header)
+
+    # Read assay
+    assay = reader.read()
+    AssayValidator(
+        investigation, investigation.studies[0], investigation.studies[0].assays[0], assay
+    ).validate()
+
+    # Check results
+    assert os.path.normpath(str(assay.file)).endswith(_SMALL2_ASSAY_PATH)
+    assert 14 == len(assay.header)
+    assert 25 == len(assay.materials)
+    assert 41 == len(assay.processes)
+    assert 74 == len(assay.arcs)
+
+    # Comments
+    expected = models.Comment(name="Replicate", value="B")
+    assert assay.materials["S1-A1-0815-T1-Pro1-B-115-COL5"].comments[0] == expected
+
+    # Arcs (order independent)
+    assert _SMALL2_ARCS == frozenset(assay.arcs)
 
 
 def test_assay_reader_gelelect(gelelect_investigation_file: TextIO, gelelect_assay_file: TextIO):
     """Use ``AssayReader`` to read in small assay file."""
+    # Load and validate investigation
     with pytest.warns(IsaWarning) as record:
-        # Load investigation
         investigation = InvestigationReader.from_stream(gelelect_investigation_file).read()
         InvestigationValidator(investigation).validate()
 
-        # Create new row reader and check read headers
-        reader = AssayReader.from_stream("S1", "A1", gelelect_assay_file)
-        assert 22 == len(reader.header)
+    # Check warnings
+    assert 3 == len(record)
+
+    # Create new row reader and check read headers
+    reader = AssayReader.from_stream("S1", "A1", gelelect_assay_file)
+    assert 22 == len(reader.header)
+
+    # Read assay
+    assay = reader.read()
 
-        # Read assay
-        assay = reader.read()
+    # Validate assay
+    with pytest.warns(IsaWarning) as record:
         AssayValidator(
             investigation, investigation.studies[0], investigation.studies[0].assays[0], assay
         ).validate()
 
     # Check warnings
-    assert 5 == len(record)
+    assert 2 == len(record)
 
     # Check results
-    assert os.path.normpath(str(assay.file)).endswith(
-        os.path.normpath(
-            "data/test_gelelect/a_study01_protein_expression_profiling_gel_electrophoresis.txt"
-        )
-    )
+    assert os.path.normpath(str(assay.file)).endswith(_GELELECT_ASSAY_PATH)
     assert 22 == len(assay.header)
     assert 10 == len(assay.materials)
     assert 11 == len(assay.processes)
@@ -818,17 +620,6 @@ def test_assay_reader_gelelect(gelelect_investigation_file: TextIO, gelelect_ass
     )
     assert expected == assay.processes["S1-A1-Scan02-18"]
 
-    header_electrophoresis = [
-        table_headers.PROTOCOL_REF,
-        table_headers.GEL_ELECTROPHORESIS_ASSAY_NAME,
-        table_headers.FIRST_DIMENSION,
-        table_headers.TERM_SOURCE_REF,
-        table_headers.TERM_ACCESSION_NUMBER,
-        table_headers.SECOND_DIMENSION,
-        table_headers.TERM_SOURCE_REF,
-        table_headers.TERM_ACCESSION_NUMBER,
-    ]
-
     expected = models.Process(
         "electrophoresis",
         "S1-A1-Assay01-10",
@@ -841,7 +632,7 @@ def test_assay_reader_gelelect(gelelect_investigation_file: TextIO, gelelect_ass
         None,
         models.OntologyTermRef("", "", ""),
         models.OntologyTermRef("", "", ""),
-        header_electrophoresis,
+        _HEADER_ELECTROPHORESIS,
     )
     assert expected == assay.processes["S1-A1-Assay01-10"]
 
@@ -857,22 +648,15 @@ def test_assay_reader_gelelect(gelelect_investigation_file: TextIO, gelelect_ass
         None,
         models.OntologyTermRef("AssayX", None, None),
         models.OntologyTermRef("AssayY", None, None),
-        header_electrophoresis,
+        _HEADER_ELECTROPHORESIS,
     )
     assert expected == assay.processes["S1-A1-electrophoresis-9-2"]
 
 
 def test_assay_reader_minimal_assay_iostring(
-    minimal_investigation_file: TextIO, minimal_assay_file: TextIO
+    minimal_investigation: models.InvestigationInfo, minimal_assay_file: TextIO
 ):
-    # Load investigation (tested elsewhere)
-    stringio = io.StringIO(minimal_investigation_file.read())
-    investigation = InvestigationReader.from_stream(stringio).read()
-    with pytest.warns(IsaWarning) as record:
-        InvestigationValidator(investigation).validate()
-
-    # Check warnings
-    assert 2 == len(record)
+    investigation = minimal_investigation
 
     stringio = io.StringIO(minimal_assay_file.read())
 
@@ -887,9 +671,7 @@ def test_assay_reader_minimal_assay_iostring(
     ).validate()
 
     # Check results
-    assert os.path.normpath(str(assay.file)).endswith(
-        os.path.normpath("data/i_minimal/a_minimal.txt")
-    )
+    assert os.path.normpath(str(assay.file)).endswith(_MINIMAL_ASSAY_PATH)
     assert 5 == len(assay.header)
     assert 3 == len(assay.materials)
     assert 1 == len(assay.processes)
@@ -897,16 +679,9 @@ def test_assay_reader_minimal_assay_iostring(
 
 
 def test_assay_reader_minimal_assay_iostring2(
-    minimal_investigation_file: TextIO, minimal_assay_file: TextIO
+    minimal_investigation: models.InvestigationInfo, minimal_assay_file: TextIO
 ):
-    # Load investigation (tested elsewhere)
-    stringio = io.StringIO(minimal_investigation_file.read())
-    investigation = InvestigationReader.from_stream(stringio).read()
-    with pytest.warns(IsaWarning) as record:
-        InvestigationValidator(investigation).validate()
-
-    # Check warnings
-    assert 2 == len(record)
+    investigation = minimal_investigation
 
     # Create new assay reader and read from StringIO with no filename indicated
     stringio = io.StringIO(minimal_assay_file.read())
@@ -18,11 +18,82 @@ from altamisa.exceptions import (
 )
 from altamisa.isatab import InvestigationReader, InvestigationValidator, models
 
+#: Expected headers shared by several tests (default order, plus comments where present)
+_ONTOLOGY_SOURCE_REF_HEADERS = [*investigation_headers.ONTOLOGY_SOURCE_REF_KEYS]
+_INVESTIGATION_INFO_HEADERS = [
+    *investigation_headers.INVESTIGATION_INFO_KEYS,
+    "Comment[Created With Configuration]",
+    "Comment[Last Opened With Configuration]",
+    "Comment[Owning Organisation URI]",
+    "Comment[Consortium URI]",
+    "Comment[Principal Investigator URI]",
+    "Comment[Investigation Keywords]",
+]
+_STUDY_INFO_HEADERS = [
+    *investigation_headers.STUDY_INFO_KEYS[0:3],
+    "Comment[Study Grant Number]",
+    "Comment[Study Funding Agency]",
+    *investigation_headers.STUDY_INFO_KEYS[3:],
+    "Comment[Manuscript Licence]",
+    "Comment[Experimental Metadata Licence]",
+    "Comment[Data Repository]",
+    "Comment[Data Record Accession]",
+    "Comment[Data Record URI]",
+    "Comment[Supplementary Information File Name]",
+    "Comment[Supplementary Information File Type]",
+    "Comment[Supplementary File URI]",
+    "Comment[Subject Keywords]",
+]
+_STUDY_CONTACTS_HEADERS = [*investigation_headers.STUDY_CONTACTS_KEYS, "Comment[Study Person REF]"]
+
+
+#: Expected values repeated across the publications and contacts of the BII-I-1 based files
+_CASTRILLO_AUTHORS = (
+    "Castrillo JI, Zeef LA, Hoyle DC, Zhang N, Hayes A, Gardner DC, "
+    "Cornell MJ, Petty J, Hakes L, Wardleworth L, Rash B, Brown M, "
+    "Dunn WB, Broadhurst D, O'Donoghue K, Hester SS, Dunkley TP, Hart "
+    "SR, Swainston N, Li P, Gaskell SJ, Paton NW, Lilley KS, Kell DB, "
+    "Oliver SG."
+)
+_CASTRILLO_TITLE = "Growth control of the eukaryote cell: a systems biology study in yeast."
+_MANCHESTER_ADDRESS = "Oxford Road, Manchester M13 9PT, UK"
+_MANCHESTER_AFFILIATION = (
+    "Faculty of Life Sciences, Michael Smith Building, University of Manchester"
+)
 
-def test_parse_minimal_investigation(minimal_investigation_file):
-    # Read Investigation from file-like object
-    reader = InvestigationReader.from_stream(minimal_investigation_file)
-    investigation = reader.read()
+
+#: Expected study and assay paths repeated across the full and comment investigation tests
+_BII_S_1_PATH = Path("s_BII-S-1.txt")
+_BII_S_2_PATH = Path("s_BII-S-2.txt")
+_TRANSCRIPTOME_ASSAY_PATH = Path("a_transcriptome.txt")
+
+
+#: Expected ontology term references repeated across the full and comment investigation tests
+_AUTHOR_ROLE = models.OntologyTermRef(
+    "author", "http://purl.obolibrary.org/obo/RoleO_0000061", "ROLEO"
+)
+_CORRESPONDING_AUTHOR_ROLE = models.OntologyTermRef("corresponding author", "", "")
+_RATE_TERM = models.OntologyTermRef("rate", "http://purl.obolibrary.org/obo/PATO_0000161", "PATO")
+_EXTRACTION_TERM = models.OntologyTermRef(
+    "extraction", "http://purl.obolibrary.org/obo/OBI_0302884", "OBI"
+)
+_INSTRUMENT_TERM = models.OntologyTermRef(
+    "instrument", "http://www.ebi.ac.uk/efo/EFO_0000548", "EFO"
+)
+
+
+#: Expected comments repeated across the full and comment investigation tests
+_EMPTY_STUDY_PERSON_REF_COMMENTS = (models.Comment("Study Person REF", ""),)
+_PERSON_B_STUDY_PERSON_REF_COMMENTS = (models.Comment("Study Person REF", "personB"),)
+_SUBTITLE_COMMENTS = (models.Comment("Subtitle", "Something"),)
+_PERSON_C_COMMENTS = (
+    models.Comment("Investigation Person ORCID", "1357908642"),
+    models.Comment("Investigation Person REF", "personC"),
+)
+
+
+def test_parse_minimal_investigation(minimal_investigation: models.InvestigationInfo):
+    investigation = minimal_investigation
     with pytest.warns(IsaWarning) as record:
         InvestigationValidator(investigation).validate()
 
@@ -41,7 +112,7 @@ def test_parse_minimal_investigation(minimal_investigation_file):
         "31",
         "Ontology for Biomedical Investigations",
         (),
-        [*investigation_headers.ONTOLOGY_SOURCE_REF_KEYS],
+        _ONTOLOGY_SOURCE_REF_HEADERS,
     )
     assert expected == investigation.ontology_source_refs["OBI"]
 
@@ -64,10 +135,8 @@ def test_parse_minimal_investigation(minimal_investigation_file):
     assert 0 == len(investigation.studies[0].contacts)
 
 
-def test_parse_small_investigation(small_investigation_file):
-    # Read Investigation from file-like object
-    reader = InvestigationReader.from_stream(small_investigation_file)
-    investigation = reader.read()
+def test_parse_small_investigation(small_investigation: models.InvestigationInfo):
+    investigation = small_investigation
     with pytest.warns(IsaWarning) as record:
         InvestigationValidator(investigation).validate()
 
@@ -80,33 +149,33 @@ def test_parse_small_investigation(small_investigation_file):
 
     # Ontology sources
     assert 4 == len(investigation.ontology_source_refs)
-    expected = models.OntologyRef(
-        "OBI",
-        "http://data.bioontology.org/ontologies/OBI",
-        "31",
-        "Ontology for Biomedical Investigations",
-        (),
-        [*investigation_headers.ONTOLOGY_SOURCE_REF_KEYS],
-    )
-    assert expected == investigation.ontology_source_refs["OBI"]
-    expected = models.OntologyRef(
-        "NCBITAXON",
-        "http://data.bioontology.org/ontologies/NCBITAXON",
-        "8",
-        ("National Center for Biotechnology Information (NCBI) Organismal " "Classification"),
-        (),
-        [*investigation_headers.ONTOLOGY_SOURCE_REF_KEYS],
-    )
-    assert expected == investigation.ontology_source_refs["NCBITAXON"]
-    expected = models.OntologyRef(
-        "ROLEO",
-        "http://data.bioontology.org/ontologies/ROLEO",
-        "1",
-        "Role Ontology",
-        (),
-        [*investigation_headers.ONTOLOGY_SOURCE_REF_KEYS],
-    )
-    assert expected == investigation.ontology_source_refs["ROLEO"]
+    expected = {
+        "OBI": models.OntologyRef(
+            "OBI",
+            "http://data.bioontology.org/ontologies/OBI",
+            "31",
+            "Ontology for Biomedical Investigations",
+            (),
+            _ONTOLOGY_SOURCE_REF_HEADERS,
+        ),
+        "NCBITAXON": models.OntologyRef(
+            "NCBITAXON",
+            "http://data.bioontology.org/ontologies/NCBITAXON",
+            "8",
+            ("National Center for Biotechnology Information (NCBI) Organismal " "Classification"),
+            (),
+            _ONTOLOGY_SOURCE_REF_HEADERS,
+        ),
+        "ROLEO": models.OntologyRef(
+            "ROLEO",
+            "http://data.bioontology.org/ontologies/ROLEO",
+            "1",
+            "Role Ontology",
+            (),
+            _ONTOLOGY_SOURCE_REF_HEADERS,
+        ),
+    }
+    assert expected == {name: investigation.ontology_source_refs.get(name) for name in expected}
 
     # Basic info
     assert "Small Investigation" == investigation.info.title
@@ -127,10 +196,8 @@ def test_parse_small_investigation(small_investigation_file):
     assert 1 == len(investigation.studies[0].contacts)
 
 
-def test_parse_full_investigation(full_investigation_file):
-    # Read Investigation from file-like object
-    reader = InvestigationReader.from_stream(full_investigation_file)
-    investigation = reader.read()
+def test_parse_full_investigation(full_investigation: models.InvestigationInfo):
+    investigation = full_investigation
     InvestigationValidator(investigation).validate()
 
     # Check results
@@ -140,24 +207,25 @@ def test_parse_full_investigation(full_investigation_file):
     # Ontology sources
     assert 9 == len(investigation.ontology_source_refs)
     expected_headers = [*investigation_headers.ONTOLOGY_SOURCE_REF_KEYS, "Comment[Test]"]
-    expected = models.OntologyRef(
-        "OBI",
-        "http://data.bioontology.org/ontologies/OBI",
-        "21",
-        "Ontology for Biomedical Investigations",
-        (models.Comment("Test", "4"),),
-        expected_headers,
-    )
-    assert expected == investigation.ontology_source_refs["OBI"]
-    expected = models.OntologyRef(
-        "NCBITAXON",
-        "http://data.bioontology.org/ontologies/NCBITAXON",
-        "2",
-        ("National Center for Biotechnology Information (NCBI) Organismal " "Classification"),
-        (models.Comment("Test", "1"),),
-        expected_headers,
-    )
-    assert expected == investigation.ontology_source_refs["NCBITAXON"]
+    expected = {
+        "OBI": models.OntologyRef(
+            "OBI",
+            "http://data.bioontology.org/ontologies/OBI",
+            "21",
+            "Ontology for Biomedical Investigations",
+            (models.Comment("Test", "4"),),
+            expected_headers,
+        ),
+        "NCBITAXON": models.OntologyRef(
+            "NCBITAXON",
+            "http://data.bioontology.org/ontologies/NCBITAXON",
+            "2",
+            ("National Center for Biotechnology Information (NCBI) Organismal " "Classification"),
+            (models.Comment("Test", "1"),),
+            expected_headers,
+        ),
+    }
+    assert expected == {name: investigation.ontology_source_refs.get(name) for name in expected}
 
     # Basic info
     assert (
@@ -167,16 +235,7 @@ def test_parse_full_investigation(full_investigation_file):
     assert date(2007, 4, 30) == investigation.info.submission_date
     assert date(2009, 3, 10) == investigation.info.public_release_date
 
-    expected_headers = [
-        *investigation_headers.INVESTIGATION_INFO_KEYS,
-        "Comment[Created With Configuration]",
-        "Comment[Last Opened With Configuration]",
-        "Comment[Owning Organisation URI]",
-        "Comment[Consortium URI]",
-        "Comment[Principal Investigator URI]",
-        "Comment[Investigation Keywords]",
-    ]
-    assert expected_headers == investigation.info.headers
+    assert _INVESTIGATION_INFO_HEADERS == investigation.info.headers
 
     # Publications
     assert 3 == len(investigation.publications)
@@ -188,12 +247,8 @@ def test_parse_full_investigation(full_investigation_file):
     expected = models.PublicationInfo(
         "17439666",
         "doi:10.1186/jbiol54",
-        "Castrillo JI, Zeef LA, Hoyle DC, Zhang N, Hayes A, Gardner DC, "
-        "Cornell MJ, Petty J, Hakes L, Wardleworth L, Rash B, Brown M, "
-        "Dunn WB, Broadhurst D, O'Donoghue K, Hester SS, Dunkley TP, Hart "
-        "SR, Swainston N, Li P, Gaskell SJ, Paton NW, Lilley KS, Kell DB, "
-        "Oliver SG.",
-        "Growth control of the eukaryote cell: a systems biology study in " "yeast.",
+        _CASTRILLO_AUTHORS,
+        _CASTRILLO_TITLE,
         models.OntologyTermRef("indexed in Pubmed", "", ""),
         (models.Comment("Subtitle", ""),),
         expected_headers,
@@ -206,7 +261,7 @@ def test_parse_full_investigation(full_investigation_file):
         "Effect of prednisolone on the cardiovascular system in complex "
         "treatment of newly detected pulmonary tuberculosis",
         models.OntologyTermRef("published", "http://www.ebi.ac.uk/efo/EFO_0001796", "EFO"),
-        (models.Comment("Subtitle", "Something"),),
+        _SUBTITLE_COMMENTS,
         expected_headers,
     )
     assert expected == investigation.publications[1]
@@ -218,70 +273,69 @@ def test_parse_full_investigation(full_investigation_file):
         "Comment[Investigation Person ORCID]",
         "Comment[Investigation Person REF]",
     ]
-    expected = models.ContactInfo(
-        "Oliver",
-        "Stephen",
-        "G",
-        "stephen.oliver@test.mail",
-        "",
-        "",
-        "Oxford Road, Manchester M13 9PT, UK",
-        "Faculty of Life Sciences, Michael Smith Building, " "University of Manchester",
-        models.OntologyTermRef("corresponding author", "", ""),
-        (
-            models.Comment("Investigation Person ORCID", "12345"),
-            models.Comment("Investigation Person REF", "personA"),
+    expected = (
+        models.ContactInfo(
+            "Oliver",
+            "Stephen",
+            "G",
+            "stephen.oliver@test.mail",
+            "",
+            "",
+            _MANCHESTER_ADDRESS,
+            _MANCHESTER_AFFILIATION,
+            _CORRESPONDING_AUTHOR_ROLE,
+            (
+                models.Comment("Investigation Person ORCID", "12345"),
+                models.Comment("Investigation Person REF", "personA"),
+            ),
+            expected_headers,
         ),
-        expected_headers,
-    )
-    assert expected == investigation.contacts[0]
-    expected = models.ContactInfo(
-        "Juan",
-        "Castrillo",
-        "I",
-        "",
-        "123456789",
-        "",
-        "Oxford Road, Manchester M13 9PT, UK",
-        "Faculty of Life Sciences, Michael Smith Building, " "University of Manchester",
-        models.OntologyTermRef("author", "", ""),
-        (
-            models.Comment("Investigation Person ORCID", "0987654321"),
-            models.Comment("Investigation Person REF", "personB"),
+        models.ContactInfo(
+            "Juan",
+            "Castrillo",
+            "I",
+            "",
+            "123456789",
+            "",
+            _MANCHESTER_ADDRESS,
+            _MANCHESTER_AFFILIATION,
+            models.OntologyTermRef("author", "", ""),
+            (
+                models.Comment("Investigation Person ORCID", "0987654321"),
+                models.Comment("Investigation Person REF", "personB"),
+            ),
+            expected_headers,
         ),
-        expected_headers,
-    )
-    assert expected == investigation.contacts[1]
-    expected = models.ContactInfo(
-        "Leo",
-        "Zeef",
-        "A",
-        "",
-        "",
-        "+49 123456789",
-        "Oxford Road, Manchester M13 9PT, UK",
-        "Faculty of Life Sciences, Michael Smith Building, " "University of Manchester",
-        models.OntologyTermRef("author", "http://purl.obolibrary.org/obo/RoleO_0000061", "ROLEO"),
-        (
-            models.Comment("Investigation Person ORCID", "1357908642"),
-            models.Comment("Investigation Person REF", "personC"),
+        models.ContactInfo(
+            "Leo",
+            "Zeef",
+            "A",
+            "",
+            "",
+            "+49 123456789",
+            _MANCHESTER_ADDRESS,
+            _MANCHESTER_AFFILIATION,
+            _AUTHOR_ROLE,
+            _PERSON_C_COMMENTS,
+            expected_headers,
         ),
-        expected_headers,
     )
-    assert expected == investigation.contacts[2]
+    assert expected == investigation.contacts
 
     # Studies
     assert len(investigation.studies) == 2
 
+
+def test_parse_full_investigation_study1(full_investigation: models.InvestigationInfo):
     # Study 1
-    study = investigation.studies[0]
+    study = full_investigation.studies[0]
     assert "BII-S-1" == study.info.identifier
     assert (
         "Study of the impact of changes in flux on the transcriptome, "
         "proteome, endometabolome and exometabolome of the yeast "
         "Saccharomyces cerevisiae under different nutrient limitations"
     ) == study.info.title
-    assert Path("s_BII-S-1.txt") == study.info.path
+    assert _BII_S_1_PATH == study.info.path
 
     # Study 1 - Design descriptors
     assert 2 == len(study.designs)
@@ -314,14 +368,10 @@ def test_parse_full_investigation(full_investigation_file):
     expected = models.PublicationInfo(
         "17439666",
         "doi:10.1186/jbiol54",
-        "Castrillo JI, Zeef LA, Hoyle DC, Zhang N, Hayes A, Gardner DC, "
-        "Cornell MJ, Petty J, Hakes L, Wardleworth L, Rash B, Brown M, "
-        "Dunn WB, Broadhurst D, O'Donoghue K, Hester SS, Dunkley TP, Hart "
-        "SR, Swainston N, Li P, Gaskell SJ, Paton NW, Lilley KS, Kell DB, "
-        "Oliver SG.",
-        "Growth control of the eukaryote cell: a systems biology study in " "yeast.",
+        _CASTRILLO_AUTHORS,
+        _CASTRILLO_TITLE,
         models.OntologyTermRef("published", "", ""),
-        (models.Comment("Subtitle", "Something"),),
+        _SUBTITLE_COMMENTS,
         [
             *investigation_headers.STUDY_PUBLICATIONS_KEYS[0:4],
             "Comment[Subtitle]",
@@ -333,22 +383,23 @@ def test_parse_full_investigation(full_investigation_file):
     # Study 1 - Factors
     assert 2 == len(study.factors)
     expected_headers = [*investigation_headers.STUDY_FACTORS_KEYS, "Comment[FactorsTest]"]
-    expected = models.FactorInfo(
-        "limiting nutrient",
-        models.OntologyTermRef(
-            "chemical entity", "http://purl.obolibrary.org/obo/CHEBI_24431", "CHEBI"
+    expected = {
+        "limiting nutrient": models.FactorInfo(
+            "limiting nutrient",
+            models.OntologyTermRef(
+                "chemical entity", "http://purl.obolibrary.org/obo/CHEBI_24431", "CHEBI"
+            ),
+            (models.Comment("FactorsTest", "1"),),
+            expected_headers,
         ),
-        (models.Comment("FactorsTest", "1"),),
-        expected_headers,
-    )
-    assert expected == study.factors["limiting nutrient"]
-    expected = models.FactorInfo(
-        "rate",
-        models.OntologyTermRef("rate", "http://purl.obolibrary.org/obo/PATO_0000161", "PATO"),
-        (models.Comment("FactorsTest", "2"),),
-        expected_headers,
-    )
-    assert expected == study.factors["rate"]
+        "rate": models.FactorInfo(
+            "rate",
+            _RATE_TERM,
+            (models.Comment("FactorsTest", "2"),),
+            expected_headers,
+        ),
+    }
+    assert expected == study.factors
 
     # Study 1 - Assays
     assert 3 == len(study.assays)
@@ -374,7 +425,7 @@ def test_parse_full_investigation(full_investigation_file):
             "DNA microarray", "http://purl.obolibrary.org/obo/OBI_0400148", "OBI"
         ),
         "Affymetrix",
-        Path("a_transcriptome.txt"),
+        _TRANSCRIPTOME_ASSAY_PATH,
         (models.Comment("Extra Info", "c"),),
         expected_headers,
     )
@@ -387,121 +438,120 @@ def test_parse_full_investigation(full_investigation_file):
         "Comment[Protocol Rating]",
         *investigation_headers.STUDY_PROTOCOLS_KEYS[7:],
     ]
-    expected = models.ProtocolInfo(
-        "growth protocol",
-        models.OntologyTermRef("growth", "", ""),
-        "1. Biomass samples (45 ml) were taken via the sample port of the "
-        "Applikon fermenters. The cells were pelleted by centrifugation for 5 "
-        "min at 5000 rpm. The supernatant was removed and the RNA pellet "
-        "resuspended in the residual medium to form a slurry. This was added "
-        "in a dropwise manner directly into a 5 ml Teflon flask (B. Braun "
-        "Biotech, Germany) containing liquid nitrogen and a 7 mm-diameter "
-        "tungsten carbide ball. After allowing evaporation of the liquid "
-        "nitrogen the flask was reassembled and the cells disrupted by "
-        "agitation at 1500 rpm for 2 min in a Microdismembranator U (B. Braun "
-        "Biotech, Germany) 2. The frozen powder was then dissolved in 1 ml of "
-        "TriZol reagent (Sigma-Aldrich, UK), vortexed for 1 min, and then kept"
-        " at room temperature for a further 5min. 3. Chloroform extraction was"
-        " performed by addition of 0.2 ml chloroform, shaking vigorously or 15"
-        " s, then 5min incubation at room temperature. 4. Following "
-        "centrifugation at 12,000 rpm for 5 min, the RNA (contained in the "
-        "aqueous phase) was precipitated with 0.5 vol of 2-propanol at room "
-        "temperature for 15 min. 5. After further centrifugation (12,000 rpm "
-        "for 10 min at 4 C) the RNA pellet was washed twice with 70 % (v/v) "
-        "ethanol, briefly air-dried, and redissolved in 0.5 ml diethyl "
-        "pyrocarbonate (DEPC)-treated water. 6. The single-stranded RNA was "
-        "precipitated once more by addition of 0.5 ml of LiCl buffer (4 M "
-        "LiCl, 20 mM Tris-HCl, pH 7.5, 10 mM EDTA), thus removing tRNA and "
-        "DNA from the sample. 7. After precipitation (20 C for 1h) and "
-        "centrifugation (12,000 rpm, 30 min, 4 C), the RNA was washed twice in"
-        " 70 % (v/v) ethanol prior to being dissolved in a minimal volume of "
-        "DEPC-treated water. 8. Total RNA quality was checked using the RNA "
-        "6000 Nano Assay, and analysed on an Agilent 2100 Bioanalyser (Agilent"
-        " Technologies). RNA was quantified using the Nanodrop ultra low "
-        "volume spectrophotometer (Nanodrop Technologies).",
-        "",
-        "",
-        {
-            "rate": models.OntologyTermRef(
-                "rate", "http://purl.obolibrary.org/obo/PATO_0000161", "PATO"
-            )
-        },
-        {},
-        (models.Comment("Protocol Rating", "1"),),
-        expected_headers,
-    )
-    assert expected == study.protocols["growth protocol"]
-    expected = models.ProtocolInfo(
-        "metabolite extraction",
-        models.OntologyTermRef("extraction", "http://purl.obolibrary.org/obo/OBI_0302884", "OBI"),
-        "",
-        "",
-        "",
-        {
-            "standard volume": models.OntologyTermRef("standard volume", "", ""),
-            "sample volume": models.OntologyTermRef("sample volume", "", ""),
-        },
-        {
-            "pipette": models.ProtocolComponentInfo(
-                "pipette",
-                models.OntologyTermRef("instrument", "http://www.ebi.ac.uk/efo/EFO_0000548", "EFO"),
-            )
-        },
-        (models.Comment("Protocol Rating", "7"),),
-        expected_headers,
-    )
-    assert expected == study.protocols["metabolite extraction"]
+    expected = {
+        "growth protocol": models.ProtocolInfo(
+            "growth protocol",
+            models.OntologyTermRef("growth", "", ""),
+            "1. Biomass samples (45 ml) were taken via the sample port of the "
+            "Applikon fermenters. The cells were pelleted by centrifugation for 5 "
+            "min at 5000 rpm. The supernatant was removed and the RNA pellet "
+            "resuspended in the residual medium to form a slurry. This was added "
+            "in a dropwise manner directly into a 5 ml Teflon flask (B. Braun "
+            "Biotech, Germany) containing liquid nitrogen and a 7 mm-diameter "
+            "tungsten carbide ball. After allowing evaporation of the liquid "
+            "nitrogen the flask was reassembled and the cells disrupted by "
+            "agitation at 1500 rpm for 2 min in a Microdismembranator U (B. Braun "
+            "Biotech, Germany) 2. The frozen powder was then dissolved in 1 ml of "
+            "TriZol reagent (Sigma-Aldrich, UK), vortexed for 1 min, and then kept"
+            " at room temperature for a further 5min. 3. Chloroform extraction was"
+            " performed by addition of 0.2 ml chloroform, shaking vigorously or 15"
+            " s, then 5min incubation at room temperature. 4. Following "
+            "centrifugation at 12,000 rpm for 5 min, the RNA (contained in the "
+            "aqueous phase) was precipitated with 0.5 vol of 2-propanol at room "
+            "temperature for 15 min. 5. After further centrifugation (12,000 rpm "
+            "for 10 min at 4 C) the RNA pellet was washed twice with 70 % (v/v) "
+            "ethanol, briefly air-dried, and redissolved in 0.5 ml diethyl "
+            "pyrocarbonate (DEPC)-treated water. 6. The single-stranded RNA was "
+            "precipitated once more by addition of 0.5 ml of LiCl buffer (4 M "
+            "LiCl, 20 mM Tris-HCl, pH 7.5, 10 mM EDTA), thus removing tRNA and "
+            "DNA from the sample. 7. After precipitation (20 C for 1h) and "
+            "centrifugation (12,000 rpm, 30 min, 4 C), the RNA was washed twice in"
+            " 70 % (v/v) ethanol prior to being dissolved in a minimal volume of "
+            "DEPC-treated water. 8. Total RNA quality was checked using the RNA "
+            "6000 Nano Assay, and analysed on an Agilent 2100 Bioanalyser (Agilent"
+            " Technologies). RNA was quantified using the Nanodrop ultra low "
+            "volume spectrophotometer (Nanodrop Technologies).",
+            "",
+            "",
+            {"rate": _RATE_TERM},
+            {},
+            (models.Comment("Protocol Rating", "1"),),
+            expected_headers,
+        ),
+        "metabolite extraction": models.ProtocolInfo(
+            "metabolite extraction",
+            _EXTRACTION_TERM,
+            "",
+            "",
+            "",
+            {
+                "standard volume": models.OntologyTermRef("standard volume", "", ""),
+                "sample volume": models.OntologyTermRef("sample volume", "", ""),
+            },
+            {
+                "pipette": models.ProtocolComponentInfo(
+                    "pipette",
+                    _INSTRUMENT_TERM,
+                )
+            },
+            (models.Comment("Protocol Rating", "7"),),
+            expected_headers,
+        ),
+    }
+    assert expected == {name: study.protocols.get(name) for name in expected}
 
     # Study 1 - Contacts
     assert 3 == len(study.contacts)
-    expected_headers = [*investigation_headers.STUDY_CONTACTS_KEYS, "Comment[Study Person REF]"]
-    expected = models.ContactInfo(
-        "Oliver",
-        "Stephen",
-        "G",
-        "stephen.oliver@test.mail",
-        "",
-        "",
-        "Oxford Road, Manchester M13 9PT, UK",
-        "Faculty of Life Sciences, Michael Smith Building, " "University of Manchester",
-        models.OntologyTermRef("corresponding author", "", ""),
-        (models.Comment("Study Person REF", ""),),
-        expected_headers,
-    )
-    assert expected == study.contacts[0]
-    expected = models.ContactInfo(
-        "Juan",
-        "Castrillo",
-        "I",
-        "",
-        "123456789",
-        "",
-        "Oxford Road, Manchester M13 9PT, UK",
-        "Faculty of Life Sciences, Michael Smith Building, " "University of Manchester",
-        models.OntologyTermRef("author", "http://purl.obolibrary.org/obo/RoleO_0000061", "ROLEO"),
-        (models.Comment("Study Person REF", ""),),
-        expected_headers,
-    )
-    assert expected == study.contacts[1]
-    expected = models.ContactInfo(
-        "Leo",
-        "Zeef",
-        "A",
-        "",
-        "",
-        "+49 123456789",
-        "Oxford Road, Manchester M13 9PT, UK",
-        "Faculty of Life Sciences, Michael Smith Building, " "University of Manchester",
-        models.OntologyTermRef("author", "http://purl.obolibrary.org/obo/RoleO_0000061", "ROLEO"),
-        (models.Comment("Study Person REF", ""),),
-        expected_headers,
+    expected_headers = _STUDY_CONTACTS_HEADERS
+    expected = (
+        models.ContactInfo(
+            "Oliver",
+            "Stephen",
+            "G",
+            "stephen.oliver@test.mail",
+            "",
+            "",
+            _MANCHESTER_ADDRESS,
+            _MANCHESTER_AFFILIATION,
+            _CORRESPONDING_AUTHOR_ROLE,
+            _EMPTY_STUDY_PERSON_REF_COMMENTS,
+            expected_headers,
+        ),
+        models.ContactInfo(
+            "Juan",
+            "Castrillo",
+            "I",
+            "",
+            "123456789",
+            "",
+            _MANCHESTER_ADDRESS,
+            _MANCHESTER_AFFILIATION,
+            _AUTHOR_ROLE,
+            _EMPTY_STUDY_PERSON_REF_COMMENTS,
+            expected_headers,
+        ),
+        models.ContactInfo(
+            "Leo",
+            "Zeef",
+            "A",
+            "",
+            "",
+            "+49 123456789",
+            _MANCHESTER_ADDRESS,
+            _MANCHESTER_AFFILIATION,
+            _AUTHOR_ROLE,
+            _EMPTY_STUDY_PERSON_REF_COMMENTS,
+            expected_headers,
+        ),
     )
-    assert expected == study.contacts[2]
+    assert expected == study.contacts
 
+
+def test_parse_full_investigation_study2(full_investigation: models.InvestigationInfo):
     # Study 2
-    study = investigation.studies[1]
+    study = full_investigation.studies[1]
     expected = models.BasicInfo(
-        Path("s_BII-S-2.txt"),
+        _BII_S_2_PATH,
         "BII-S-2",
         "A time course analysis of transcription response in yeast treated "
         "with rapamycin, a specific inhibitor of the TORC1 complex: impact "
@@ -541,21 +591,7 @@ def test_parse_full_investigation(full_investigation_file):
             models.Comment("Supplementary File URI", ""),
             models.Comment("Subject Keywords", ""),
         ),
-        [
-            *investigation_headers.STUDY_INFO_KEYS[0:3],
-            "Comment[Study Grant Number]",
-            "Comment[Study Funding Agency]",
-            *investigation_headers.STUDY_INFO_KEYS[3:],
-            "Comment[Manuscript Licence]",
-            "Comment[Experimental Metadata Licence]",
-            "Comment[Data Repository]",
-            "Comment[Data Record Accession]",
-            "Comment[Data Record URI]",
-            "Comment[Supplementary Information File Name]",
-            "Comment[Supplementary Information File Type]",
-            "Comment[Supplementary File URI]",
-            "Comment[Subject Keywords]",
-        ],
+        _STUDY_INFO_HEADERS,
     )
     assert expected == study.info
 
@@ -602,7 +638,7 @@ def test_parse_full_investigation(full_investigation_file):
             ),
             "Bruker-Av600": models.ProtocolComponentInfo(
                 "Bruker-Av600",
-                models.OntologyTermRef("instrument", "http://www.ebi.ac.uk/efo/EFO_0000548", "EFO"),
+                _INSTRUMENT_TERM,
             ),
         },
         (),
@@ -619,19 +655,17 @@ def test_parse_full_investigation(full_investigation_file):
         "",
         "123456789",
         "",
-        "Oxford Road, Manchester M13 9PT, UK",
-        "Faculty of Life Sciences, Michael Smith Building, " "University of Manchester",
-        models.OntologyTermRef("author", "http://purl.obolibrary.org/obo/RoleO_0000061", "ROLEO"),
-        (models.Comment("Study Person REF", "personB"),),
-        [*investigation_headers.STUDY_CONTACTS_KEYS, "Comment[Study Person REF]"],
+        _MANCHESTER_ADDRESS,
+        _MANCHESTER_AFFILIATION,
+        _AUTHOR_ROLE,
+        _PERSON_B_STUDY_PERSON_REF_COMMENTS,
+        _STUDY_CONTACTS_HEADERS,
     )
     assert expected == study.contacts[1]
 
 
-def test_parse_comment_investigation(comment_investigation_file):
-    # Read Investigation from file-like object
-    reader = InvestigationReader.from_stream(comment_investigation_file)
-    investigation = reader.read()
+def test_parse_comment_investigation(comment_investigation: models.InvestigationInfo):
+    investigation = comment_investigation
     InvestigationValidator(investigation).validate()
 
     # Check results
@@ -659,27 +693,15 @@ def test_parse_comment_investigation(comment_investigation_file):
     assert "Owning Organisation URI" == investigation.info.comments[2].name
     assert "TestValue01" == investigation.info.comments[2].value
 
-    expected_headers = [
-        *investigation_headers.INVESTIGATION_INFO_KEYS,
-        "Comment[Created With Configuration]",
-        "Comment[Last Opened With Configuration]",
-        "Comment[Owning Organisation URI]",
-        "Comment[Consortium URI]",
-        "Comment[Principal Investigator URI]",
-        "Comment[Investigation Keywords]",
-    ]
+    assert _INVESTIGATION_INFO_HEADERS == investigation.info.headers
 
     # Publications
     assert 3 == len(investigation.publications)
     expected = models.PublicationInfo(
         "17439666",
         "doi:10.1186/jbiol54",
-        "Castrillo JI, Zeef LA, Hoyle DC, Zhang N, Hayes A, Gardner DC, "
-        "Cornell MJ, Petty J, Hakes L, Wardleworth L, Rash B, Brown M, "
-        "Dunn WB, Broadhurst D, O'Donoghue K, Hester SS, Dunkley TP, Hart "
-        "SR, Swainston N, Li P, Gaskell SJ, Paton NW, Lilley KS, Kell DB, "
-        "Oliver SG.",
-        "Growth control of the eukaryote cell: a systems biology study in " "yeast.",
+        _CASTRILLO_AUTHORS,
+        _CASTRILLO_TITLE,
         models.OntologyTermRef("indexed in Pubmed", "", ""),
         (models.Comment("InvestPubsComment", "TestValue01"),),
         [
@@ -699,13 +721,10 @@ def test_parse_comment_investigation(comment_investigation_file):
         "",
         "",
         "+49 123456789",
-        "Oxford Road, Manchester M13 9PT, UK",
-        "Faculty of Life Sciences, Michael Smith Building, " "University of Manchester",
-        models.OntologyTermRef("author", "http://purl.obolibrary.org/obo/RoleO_0000061", "ROLEO"),
-        (
-            models.Comment("Investigation Person ORCID", "1357908642"),
-            models.Comment("Investigation Person REF", "personC"),
-        ),
+        _MANCHESTER_ADDRESS,
+        _MANCHESTER_AFFILIATION,
+        _AUTHOR_ROLE,
+        _PERSON_C_COMMENTS,
         [
             *investigation_headers.INVESTIGATION_CONTACTS_KEYS,
             "Comment[Investigation Person ORCID]",
@@ -717,29 +736,16 @@ def test_parse_comment_investigation(comment_investigation_file):
     # Studies
     assert len(investigation.studies) == 2
 
+
+def test_parse_comment_investigation_study1(comment_investigation: models.InvestigationInfo):
     # Study 1
-    study = investigation.studies[0]
+    study = comment_investigation.studies[0]
     assert "BII-S-1" == study.info.identifier
-    assert Path("s_BII-S-1.txt") == study.info.path
+    assert _BII_S_1_PATH == study.info.path
     assert "Manuscript Licence" == study.info.comments[2].name
     assert "CC BY 3.0" == study.info.comments[2].value
 
-    expected_headers = [
-        *investigation_headers.STUDY_INFO_KEYS[0:3],
-        "Comment[Study Grant Number]",
-        "Comment[Study Funding Agency]",
-        *investigation_headers.STUDY_INFO_KEYS[3:],
-        "Comment[Manuscript Licence]",
-        "Comment[Experimental Metadata Licence]",
-        "Comment[Data Repository]",
-        "Comment[Data Record Accession]",
-        "Comment[Data Record URI]",
-        "Comment[Supplementary Information File Name]",
-        "Comment[Supplementary Information File Type]",
-        "Comment[Supplementary File URI]",
-        "Comment[Subject Keywords]",
-    ]
-    assert expected_headers == study.info.headers
+    assert _STUDY_INFO_HEADERS == study.info.headers
 
     # Study 1 - Design descriptors
     assert 2 == len(study.designs)
@@ -757,12 +763,8 @@ def test_parse_comment_investigation(comment_investigation_file):
     expected = models.PublicationInfo(
         "17439666",
         "doi:10.1186/jbiol54",
-        "Castrillo JI, Zeef LA, Hoyle DC, Zhang N, Hayes A, Gardner DC, "
-        "Cornell MJ, Petty J, Hakes L, Wardleworth L, Rash B, Brown M, "
-        "Dunn WB, Broadhurst D, O'Donoghue K, Hester SS, Dunkley TP, Hart "
-        "SR, Swainston N, Li P, Gaskell SJ, Paton NW, Lilley KS, Kell DB, "
-        "Oliver SG.",
-        "Growth control of the eukaryote cell: a systems biology study in " "yeast.",
+        _CASTRILLO_AUTHORS,
+        _CASTRILLO_TITLE,
         models.OntologyTermRef("published", "", ""),
         (models.Comment("StudyPubsComment", "TestValue01"),),
         [
@@ -777,7 +779,7 @@ def test_parse_comment_investigation(comment_investigation_file):
     assert 2 == len(study.factors)
     expected = models.FactorInfo(
         "rate",
-        models.OntologyTermRef("rate", "http://purl.obolibrary.org/obo/PATO_0000161", "PATO"),
+        _RATE_TERM,
         (models.Comment("FactorsComment", "TestValue01"),),
         [*investigation_headers.STUDY_FACTORS_KEYS, "Comment[FactorsComment]"],
     )
@@ -793,7 +795,7 @@ def test_parse_comment_investigation(comment_investigation_file):
             "DNA microarray", "http://purl.obolibrary.org/obo/OBI_0400148", "OBI"
         ),
         "Affymetrix",
-        Path("a_transcriptome.txt"),
+        _TRANSCRIPTOME_ASSAY_PATH,
         (models.Comment("AssaysComment", "A comment within ontology terms?"),),
         [
             *investigation_headers.STUDY_ASSAYS_KEYS[0:5],
@@ -807,7 +809,7 @@ def test_parse_comment_investigation(comment_investigation_file):
     assert 7 == len(study.protocols)
     expected = models.ProtocolInfo(
         "metabolite extraction",
-        models.OntologyTermRef("extraction", "http://purl.obolibrary.org/obo/OBI_0302884", "OBI"),
+        _EXTRACTION_TERM,
         "",
         "",
         "",
@@ -818,7 +820,7 @@ def test_parse_comment_investigation(comment_investigation_file):
         {
             "pipette": models.ProtocolComponentInfo(
                 "pipette",
-                models.OntologyTermRef("instrument", "http://www.ebi.ac.uk/efo/EFO_0000548", "EFO"),
+                _INSTRUMENT_TERM,
             )
         },
         (models.Comment("ProtocolsComment", "TestValue01"),),
@@ -839,39 +841,26 @@ def test_parse_comment_investigation(comment_investigation_file):
         "",
         "123456789",
         "",
-        "Oxford Road, Manchester M13 9PT, UK",
-        "Faculty of Life Sciences, Michael Smith Building, " "University of Manchester",
-        models.OntologyTermRef("author", "http://purl.obolibrary.org/obo/RoleO_0000061", "ROLEO"),
-        (models.Comment("Study Person REF", ""),),
-        [*investigation_headers.STUDY_CONTACTS_KEYS, "Comment[Study Person REF]"],
+        _MANCHESTER_ADDRESS,
+        _MANCHESTER_AFFILIATION,
+        _AUTHOR_ROLE,
+        _EMPTY_STUDY_PERSON_REF_COMMENTS,
+        _STUDY_CONTACTS_HEADERS,
     )
     assert expected == study.contacts[1]
 
+
+def test_parse_comment_investigation_study2(comment_investigation: models.InvestigationInfo):
     # Study 2
-    study = investigation.studies[1]
+    study = comment_investigation.studies[1]
     assert "BII-S-2" == study.info.identifier
-    assert Path("s_BII-S-2.txt") == study.info.path
+    assert _BII_S_2_PATH == study.info.path
     assert "Study Grant Number" == study.info.comments[0].name
     assert "" == study.info.comments[0].value
     assert "Manuscript Licence" == study.info.comments[2].name
     assert "CC BY 3.0" == study.info.comments[2].value
 
-    expected_headers = [
-        *investigation_headers.STUDY_INFO_KEYS[0:3],
-        "Comment[Study Grant Number]",
-        "Comment[Study Funding Agency]",
-        *investigation_headers.STUDY_INFO_KEYS[3:],
-        "Comment[Manuscript Licence]",
-        "Comment[Experimental Metadata Licence]",
-        "Comment[Data Repository]",
-        "Comment[Data Record Accession]",
-        "Comment[Data Record URI]",
-        "Comment[Supplementary Information File Name]",
-        "Comment[Supplementary Information File Type]",
-        "Comment[Supplementary File URI]",
-        "Comment[Subject Keywords]",
-    ]
-    assert expected_headers == study.info.headers
+    assert _STUDY_INFO_HEADERS == study.info.headers
 
     # Study 2 - Contacts
     assert 3 == len(study.contacts)
@@ -882,11 +871,11 @@ def test_parse_comment_investigation(comment_investigation_file):
         "",
         "123456789",
         "",
-        "Oxford Road, Manchester M13 9PT, UK",
-        "Faculty of Life Sciences, Michael Smith Building, " "University of Manchester",
-        models.OntologyTermRef("author", "http://purl.obolibrary.org/obo/RoleO_0000061", "ROLEO"),
-        (models.Comment("Study Person REF", "personB"),),
-        [*investigation_headers.STUDY_CONTACTS_KEYS, "Comment[Study Person REF]"],
+        _MANCHESTER_ADDRESS,
+        _MANCHESTER_AFFILIATION,
+        _AUTHOR_ROLE,
+        _PERSON_B_STUDY_PERSON_REF_COMMENTS,
+        _STUDY_CONTACTS_HEADERS,
     )
     assert expected == study.contacts[1]
 
@@ -980,7 +969,7 @@ def test_parse_warnings_investigation(warnings_investigation_file):
         "31",
         "Ontology for Biomedical Investigations",
         (),
-        [*investigation_headers.ONTOLOGY_SOURCE_REF_KEYS],
+        _ONTOLOGY_SOURCE_REF_HEADERS,
     )
     assert expected == investigation.ontology_source_refs["OBI"]
 
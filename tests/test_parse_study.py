@@ -20,6 +20,10 @@ from altamisa.isatab import (
     models,
 )
 
+# Normalized expected path suffixes of the study files
+_MINIMAL_STUDY_PATH = os.path.normpath("data/i_minimal/s_minimal.txt")
+_SMALL_STUDY_PATH = os.path.normpath("data/i_small/s_small.txt")
+
 
 def test_study_row_reader_minimal_study(minimal_investigation_file, minimal_study_file):
     """Use ``StudyRowReader`` to read in minimal study file."""
@@ -71,15 +75,14 @@ def test_study_row_reader_minimal_study(minimal_investigation_file, minimal_stud
 
 
 def test_study_reader_minimal_study(
-    minimal_investigation_file, minimal_study_file, snapshot: SnapshotAssertion
+    minimal_investigation, minimal_study_file, snapshot: SnapshotAssertion
 ):
     """Use ``StudyReader`` to read in minimal study file.
 
     Using the ``StudyReader`` instead of the ``StudyRowReader`` gives us
     ``Study`` objects instead of just the row-wise nodes.
     """
-    # Load investigation (tested elsewhere)
-    investigation = InvestigationReader.from_stream(minimal_investigation_file).read()
+    investigation = minimal_investigation
     with pytest.warns(IsaWarning) as record:
         InvestigationValidator(investigation).validate()
 
@@ -95,9 +98,7 @@ def test_study_reader_minimal_study(
     StudyValidator(investigation, investigation.studies[0], study).validate()
 
     # Check results
-    assert os.path.normpath(str(study.file)).endswith(
-        os.path.normpath("data/i_minimal/s_minimal.txt")
-    )
+    assert os.path.normpath(str(study.file)).endswith(_MINIMAL_STUDY_PATH)
     assert 3 == len(study.header)
     assert 2 == len(study.materials)
     assert 1 == len(study.processes)
@@ -322,12 +323,11 @@ def test_study_row_reader_small_study(small_investigation_file, small_study_file
 
 
 def test_study_reader_small_study(
-    small_investigation_file, small_study_file, snapshot: SnapshotAssertion
+    small_investigation: models.InvestigationInfo, small_study_file, snapshot: SnapshotAssertion
 ):
     """Use ``StudyReader`` to read in small study file."""
-    # Load investigation (tested elsewhere)
+    investigation = small_investigation
     with pytest.warns(IsaWarning) as record:
-        investigation = InvestigationReader.from_stream(small_investigation_file).read()
         InvestigationValidator(investigation).validate()
 
     # Check warnings
@@ -345,7 +345,7 @@ def test_study_reader_small_study(
     assert snapshot == [str(r.message) for r in record]
 
     # Check results
-    assert os.path.normpath(str(study.file)).endswith(os.path.normpath("data/i_small/s_small.txt"))
+    assert os.path.normpath(str(study.file)).endswith(_SMALL_STUDY_PATH)
     assert 13 == len(study.header)
     assert 11 == len(study.materials)
     assert 6 == len(study.processes)
@@ -586,9 +586,7 @@ def test_study_reader_minimal_study_iostring(
     StudyValidator(investigation, investigation.studies[0], study).validate()
 
     # Check results
-    assert os.path.normpath(str(study.file)).endswith(
-        os.path.normpath("data/i_minimal/s_minimal.txt")
-    )
+    assert os.path.normpath(str(study.file)).endswith(_MINIMAL_STUDY_PATH)
     assert 3 == len(study.header)
     assert 2 == len(study.materials)
     assert 1 == len(study.processes)
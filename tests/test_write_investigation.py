@@ -3,7 +3,9 @@
 
 
 import filecmp
+import io
 
+import attr
 import pytest
 
 from altamisa.exceptions import (
@@ -11,12 +13,14 @@ from altamisa.exceptions import (
     IsaWarning,
     ModerateIsaValidationWarning,
     ParseIsatabWarning,
+    WriteIsatabException,
     WriteIsatabWarning,
 )
 from altamisa.isatab import (
     InvestigationReader,
     InvestigationValidator,
     InvestigationWriter,
+    models,
 )
 
 # Tests with one-time reading and writing
@@ -66,9 +70,10 @@ def test_write_small_investigation(small_investigation_file, tmp_path):
     assert filecmp.cmp(small_investigation_file.name, path, shallow=False)
 
 
-def test_write_comment_investigation(comment_investigation_file, tmp_path):
-    # Read Investigation from file-like object
-    investigation = InvestigationReader.from_stream(comment_investigation_file).read()
+def test_write_comment_investigation(
+    comment_investigation: models.InvestigationInfo, comment_investigation_file, tmp_path
+):
+    investigation = comment_investigation
     InvestigationValidator(investigation).validate()
     # Write Investigation to temporary file
     path = tmp_path / "i_comments.txt"
@@ -156,9 +161,8 @@ def test_write_assays_investigation(assays_investigation_file, tmp_path):
     assert filecmp.cmp(path1, path2, shallow=False)
 
 
-def test_write_full_investigation(full_investigation_file, tmp_path):
-    # Read Investigation from file-like object
-    investigation = InvestigationReader.from_stream(full_investigation_file).read()
+def test_write_full_investigation(full_investigation: models.InvestigationInfo, tmp_path):
+    investigation = full_investigation
     InvestigationValidator(investigation).validate()
     # Write Investigation to temporary file
     path1 = tmp_path / "i_fullinvest.txt"
@@ -176,6 +180,62 @@ def test_write_full_investigation(full_investigation_file, tmp_path):
     assert filecmp.cmp(path1, path2, shallow=False)
 
 
+def test_write_full_investigation_protocol_components(
+    full_investigation: models.InvestigationInfo, full_investigation_file
+):
+    # Write Investigation to string buffer
+    output = io.StringIO()
+    InvestigationWriter.from_stream(full_investigation, output, lineterminator="\n").write()
+    # Compare component names and types (and their term references) of input and output
+    expected = [
+        line.rstrip("\n")
+        for line in full_investigation_file
+        if line.startswith("Study Protocol Components")
+    ]
+    actual = [
+        line
+        for line in output.getvalue().splitlines()
+        if line.startswith("Study Protocol Components")
+    ]
+    assert 8 == len(expected)
+    assert expected == actual
+
+
+def test_write_full_investigation_escaped_values(full_investigation: models.InvestigationInfo):
+    # Add characters requiring escaping to the Investigation
+    investigation = full_investigation
+    info = attr.evolve(investigation.info, description="tab\there, backslash \\ here")
+    investigation = attr.evolve(investigation, info=info)
+    # Write Investigation to string buffer
+    output = io.StringIO()
+    InvestigationWriter.from_stream(investigation, output, lineterminator="\n").write()
+    # Only the affected section is escaped
+    lines = output.getvalue().splitlines()
+    assert "Investigation Description\ttab\\\there, backslash \\\\ here" in lines
+    title = "Growth control of the eukaryote cell: a systems biology study in yeast"
+    assert f"Investigation Title\t{title}" in lines
+
+
+def test_write_full_investigation_partial_on_error(
+    full_investigation: models.InvestigationInfo, monkeypatch
+):
+    # Fail while writing the studies
+    def fail(self):
+        raise WriteIsatabException("failing study")
+
+    monkeypatch.setattr(InvestigationWriter, "_write_studies", fail)
+    # Write Investigation to string buffer
+    output = io.StringIO()
+    writer = InvestigationWriter.from_stream(full_investigation, output, lineterminator="\n")
+    with pytest.raises(WriteIsatabException):
+        writer.write()
+    # The sections written before the error are passed on to the output
+    lines = output.getvalue().splitlines()
+    assert "ONTOLOGY SOURCE REFERENCE" == lines[0]
+    assert "INVESTIGATION CONTACTS" in lines
+    assert "STUDY" not in lines
+
+
 def test_write_BII_I_1_investigation(BII_I_1_investigation_file, tmp_path):
     # Read Investigation from file-like object
     with pytest.warns(IsaWarning) as record:
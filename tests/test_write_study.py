@@ -3,6 +3,7 @@
 
 
 import filecmp
+import io
 import os
 
 import pytest
@@ -11,6 +12,7 @@ from altamisa.exceptions import (
     IsaWarning,
     ModerateIsaValidationWarning,
     ParseIsatabWarning,
+    WriteIsatabException,
 )
 from altamisa.isatab import (
     InvestigationReader,
@@ -96,3 +98,22 @@ def test_study_writer_gelelect(gelelect_investigation_file, tmp_path):
     msg = "Study without title:\nID:\tstudy01\nTitle:\t\nPath:\ts_study01.txt"
     assert record[2].category == ModerateIsaValidationWarning
     assert str(record[2].message) == msg
+
+
+def test_study_writer_partial_on_error(small_study_file, monkeypatch):
+    # Load study
+    study = StudyReader.from_stream("S1", small_study_file).read()
+
+    # Fail while writing the nodes
+    def fail(self):
+        raise WriteIsatabException("failing node")
+
+    monkeypatch.setattr(StudyWriter, "_extract_and_write_nodes", fail)
+    # Write study to string buffer
+    output = io.StringIO()
+    with pytest.raises(WriteIsatabException):
+        StudyWriter.from_stream(study, output, lineterminator="\n").write()
+    # The header written before the error is passed on to the output
+    lines = output.getvalue().splitlines()
+    assert 1 == len(lines)
+    assert lines[0].startswith("Source Name\t")